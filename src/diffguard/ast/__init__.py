@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from diffguard.ast.languages import Language, detect_language
-from diffguard.ast.parser import clear_parser_cache, get_parser, parse_file
+from diffguard.ast.parser import clear_parse_cache, clear_parser_cache, get_parser, parse_file
 from diffguard.ast.python import Import
 from diffguard.ast.scope import Scope, extract_scope_context, find_enclosing_scope
 
@@ -18,6 +18,7 @@ __all__ = [
     "Import",
     "Language",
     "Scope",
+    "clear_parse_cache",
     "clear_parser_cache",
     "detect_language",
     "extract_imports",
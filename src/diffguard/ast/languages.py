@@ -1,7 +1,6 @@
 """Language detection and extension mapping for tree-sitter parsing."""
 
 import enum
-from pathlib import PurePosixPath
 
 
 class Language(enum.Enum):
@@ -67,6 +66,10 @@ _COMPOUND_EXTENSION_MAP: dict[str, Language] = {
     ".blade.php": Language.HTML,
 }
 
+# Final suffixes of compound extensions (".php" for ".blade.php"), so the compound scan only
+# runs for names that could match one
+_COMPOUND_FINAL_SUFFIXES: frozenset[str] = frozenset("." + ext.rpartition(".")[2] for ext in _COMPOUND_EXTENSION_MAP)
+
 _FILENAME_MAP: dict[str, Language] = {
     "Makefile": Language.MAKEFILE,
     "makefile": Language.MAKEFILE,
@@ -82,15 +85,23 @@ def detect_language(file_path: str) -> Language | None:
     Checks compound extensions (e.g. .blade.php) before single-suffix lookup.
     Falls back to filename-based detection for extensionless files (e.g. Makefile).
     """
-    path = PurePosixPath(file_path)
-    name_lower = path.name.lower()
+    name = file_path.rpartition("/")[2]
+
+    # Same rule as PurePosixPath.suffix: a leading or trailing dot is not an extension
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return _FILENAME_MAP.get(name)
+
+    # Extensions are almost always already lowercase, so only lowercase on a miss
+    suffix = name[dot:]
+    if suffix not in _EXTENSION_MAP:
+        suffix = suffix.lower()
 
     # Check compound extensions first (e.g. .blade.php before .php)
-    for compound_ext, lang in _COMPOUND_EXTENSION_MAP.items():
-        if name_lower.endswith(compound_ext):
-            return lang
-
-    suffix = path.suffix.lower()
-    if suffix:
-        return _EXTENSION_MAP.get(suffix)
-    return _FILENAME_MAP.get(path.name)
+    if suffix in _COMPOUND_FINAL_SUFFIXES:
+        name_lower = name.lower()
+        for compound_ext, lang in _COMPOUND_EXTENSION_MAP.items():
+            if name_lower.endswith(compound_ext):
+                return lang
+
+    return _EXTENSION_MAP.get(suffix)
@@ -1,6 +1,9 @@
 """Tree-sitter parser creation, caching, and source file parsing."""
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 
 from tree_sitter import Language as TSLanguage
 from tree_sitter import Parser, Tree
@@ -10,7 +13,13 @@ from diffguard.exceptions import UnsupportedLanguageError
 
 logger = logging.getLogger(__name__)
 
-_parser_cache: dict[Language, Parser] = {}
+# tree-sitter Parser objects must not be used from several threads at once,
+# so each thread keeps its own parser per language.
+_parser_cache = threading.local()
+
+_PARSE_CACHE_MAXSIZE = 128
+_parse_cache: OrderedDict[tuple[bytes, Language], Tree] = OrderedDict()
+_parse_cache_lock = threading.Lock()
 
 
 def _load_language(language: Language) -> TSLanguage:  # noqa: PLR0911
@@ -56,26 +65,44 @@ def _load_language(language: Language) -> TSLanguage:  # noqa: PLR0911
             raise UnsupportedLanguageError(f"No tree-sitter grammar installed for {language.value}")
 
 
+def _thread_parsers() -> dict[Language, Parser]:
+    """Return the calling thread's parser cache, creating it on first use."""
+    parsers: dict[Language, Parser] | None = getattr(_parser_cache, "parsers", None)
+    if parsers is None:
+        parsers = {}
+        _parser_cache.parsers = parsers
+    return parsers
+
+
 def clear_parser_cache() -> None:
-    """Clear the cached tree-sitter parsers (useful for testing)."""
-    _parser_cache.clear()
+    """Clear the calling thread's cached tree-sitter parsers (useful for testing)."""
+    _thread_parsers().clear()
+
+
+def clear_parse_cache() -> None:
+    """Clear the cached parse trees (useful for testing)."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
 
 
 def get_parser(language: Language) -> Parser:
     """Return a cached tree-sitter Parser for the given language.
 
     Creates and caches the parser on first call; returns the same
-    instance on subsequent calls for the same language.
+    instance on subsequent calls for the same language from the same
+    thread. Each thread gets its own parser, so files can be parsed
+    concurrently.
 
     Raises UnsupportedLanguageError if no grammar is available.
     """
-    if language in _parser_cache:
-        return _parser_cache[language]
+    parsers = _thread_parsers()
+    if language in parsers:
+        return parsers[language]
 
     ts_language = _load_language(language)
     parser = Parser()
     parser.language = ts_language
-    _parser_cache[language] = parser
+    parsers[language] = parser
     return parser
 
 
@@ -89,23 +116,58 @@ def _is_severely_malformed(tree: Tree) -> bool:
     if not tree.root_node.has_error:
         return False
 
-    named_children = tree.root_node.named_children
-    if not named_children:
+    # Walk the root's children with a cursor and stop at the first recovered node,
+    # rather than materializing the full named_children list
+    cursor = tree.walk()
+    if not cursor.goto_first_child():
         return True
 
-    return all(child.type == "ERROR" for child in named_children)
+    while True:
+        node = cursor.node
+        if node is not None and node.is_named and node.type != "ERROR":
+            return False
+        if not cursor.goto_next_sibling():
+            return True
+
+
+def _parse_cached(source_bytes: bytes, language: Language) -> Tree | None:
+    """Parse source bytes, reusing the tree from an earlier parse of identical content.
 
+    Keyed on a blake2b digest of the source plus the language, bounded to the
+    most recently used entries. Trees are never edited after parsing, so a
+    cached tree can be shared between callers.
+    """
+    key = (hashlib.blake2b(source_bytes, digest_size=16).digest(), language)
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+            return cached
+
+    tree = get_parser(language).parse(source_bytes)
+    if tree is None:
+        return None
 
-def parse_file(source: str, language: Language) -> Tree | None:
+    with _parse_cache_lock:
+        _parse_cache[key] = tree
+        if len(_parse_cache) > _PARSE_CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
+    return tree
+
+
+def parse_file(source: str | bytes, language: Language) -> Tree | None:
     """Parse source code into a tree-sitter Tree.
 
+    Accepts either text or UTF-8 encoded bytes; bytes (e.g. straight from
+    the file on disk) are handed to the parser without re-encoding.
+
     Returns None (with a warning log) when the source is severely
     malformed and no meaningful AST structure could be recovered.
     Partial parse errors (e.g. a single syntax mistake) still return
     a Tree with ERROR nodes embedded in an otherwise valid structure.
     """
-    parser = get_parser(language)
-    tree = parser.parse(bytes(source, "utf-8"))
+    source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+    tree = _parse_cached(source_bytes, language)
 
     if tree is None:
         return None
@@ -13,7 +13,8 @@ from typing import TYPE_CHECKING
 from diffguard.ast.scope import Scope
 
 if TYPE_CHECKING:
-    from tree_sitter import Node, Tree
+    from tree_sitter import Language as TSLanguage
+    from tree_sitter import Node, Tree, TreeCursor
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,29 @@ _NODE_TYPE_TO_SCOPE_TYPE: dict[str, str] = {
 }
 
 
+@dataclass(frozen=True)
+class _ScopeKindIds:
+    """Numeric node-kind IDs for the scope node types of one grammar."""
+
+    scopes: frozenset[int]
+    decorated: int
+
+
+@lru_cache(maxsize=4)
+def _scope_kind_ids(language: TSLanguage) -> _ScopeKindIds:
+    """Resolve scope node types to kind IDs so the descent compares ints rather than type strings."""
+    return _ScopeKindIds(
+        scopes=frozenset(_kind_id(language, name) for name in _SCOPE_NODE_TYPES),
+        decorated=_kind_id(language, "decorated_definition"),
+    )
+
+
+def _kind_id(language: TSLanguage, name: str) -> int:
+    """Look up a named node kind's ID, or -1 (matches no node) if the grammar lacks it."""
+    kind_id = language.id_for_node_kind(name, True)
+    return -1 if kind_id is None else kind_id
+
+
 def find_python_scope(tree: Tree, line: int) -> Scope | None:
     """Find the innermost Python scope containing a 1-indexed line.
 
@@ -52,47 +76,61 @@ def find_python_scope(tree: Tree, line: int) -> Scope | None:
     are not treated as scopes.
     """
     row = line - 1
-    node = _find_innermost_scope_node(tree.root_node, row)
+    node = _find_innermost_scope_node(tree, row)
     if node is None:
         return None
     return _node_to_scope(node)
 
 
-def _find_innermost_scope_node(root: Node, row: int) -> Node | None:
-    """Walk the AST depth-first to find the innermost scope node containing the row (0-indexed)."""
-    best: Node | None = None
+def _find_innermost_scope_node(tree: Tree, row: int) -> Node | None:
+    """Descend the AST with a TreeCursor to find the innermost scope node containing the row (0-indexed).
 
-    for child in root.children:
-        if not (child.start_point.row <= row <= child.end_point.row):
-            continue
+    The cursor moves between nodes inside tree-sitter, so only the nodes on the
+    path to the row are materialized as Python objects.
+    """
+    kinds = _scope_kind_ids(tree.language)
+    cursor = tree.walk()
+    best: Node | None = None
 
-        if child.type == "decorated_definition":
-            inner = _definition_from_decorated(child)
-            if inner is not None:
-                best = inner
-                # Only recurse deeper if the row is within the definition body itself
-                if inner.start_point.row <= row <= inner.end_point.row:
-                    deeper = _find_innermost_scope_node(inner, row)
-                    if deeper is not None:
-                        best = deeper
-        elif child.type in _SCOPE_NODE_TYPES:
-            best = child
-            deeper = _find_innermost_scope_node(child, row)
-            if deeper is not None:
-                best = deeper
-        else:
-            deeper = _find_innermost_scope_node(child, row)
-            if deeper is not None:
-                best = deeper
+    while (node := _goto_child_containing_row(cursor, row)) is not None:
+        kind = node.kind_id
+        if kind == kinds.decorated:
+            inner = _goto_decorated_definition(cursor, kinds.scopes)
+            if inner is None:
+                break
+            best = inner
+            # Only descend deeper if the row is within the definition body itself
+            if not (inner.start_point.row <= row <= inner.end_point.row):
+                break
+        elif kind in kinds.scopes:
+            best = node
 
     return best
 
 
-def _definition_from_decorated(node: Node) -> Node | None:
-    """Extract the function/class definition from a decorated_definition node."""
-    for child in node.children:
-        if child.type in _SCOPE_NODE_TYPES:
-            return child
+def _goto_child_containing_row(cursor: TreeCursor, row: int) -> Node | None:
+    """Move the cursor to the first child whose line range contains the row and return it.
+
+    Children are ordered by source position, so tree-sitter can locate the first
+    child ending at or after the row without visiting the earlier siblings from Python.
+    """
+    if cursor.goto_first_child_for_point((row, 0)) is None:
+        return None
+    node = cursor.node
+    if node is None or node.start_point.row > row:
+        return None
+    return node
+
+
+def _goto_decorated_definition(cursor: TreeCursor, scope_kinds: frozenset[int]) -> Node | None:
+    """Move the cursor from a decorated_definition to its function/class definition and return it."""
+    if not cursor.goto_first_child():
+        return None
+    while (node := cursor.node) is not None:
+        if node.kind_id in scope_kinds:
+            return node
+        if not cursor.goto_next_sibling():
+            return None
     return None
 
 
@@ -107,9 +145,9 @@ def _node_to_scope(node: Node) -> Scope:
 def _get_node_name(node: Node) -> str:
     """Extract the name identifier from a function or class definition node."""
     name_node = node.child_by_field_name("name")
-    if name_node is None or name_node.text is None:
+    if name_node is None or (text := name_node.text) is None:
         return "<unknown>"
-    return str(name_node.text, "utf-8")
+    return text.decode()
 
 
 def _get_effective_line_range(node: Node) -> tuple[int, int]:
@@ -143,9 +181,11 @@ class Import:
 
 def _node_text(node: Node) -> str:
     """Get the UTF-8 text of a tree-sitter node."""
-    if node.text is None:
+    # Each Node.text access slices the source again, so read it only once
+    text = node.text
+    if text is None:
         return ""
-    return str(node.text, "utf-8")
+    return text.decode()
 
 
 def extract_python_imports(tree: Tree) -> list[Import]:
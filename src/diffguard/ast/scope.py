@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from diffguard.ast.languages import Language
@@ -11,7 +13,7 @@ if TYPE_CHECKING:
     from tree_sitter import Tree
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Scope:
     """An enclosing code scope (function, class, method).
 
@@ -24,7 +26,38 @@ class Scope:
     end_line: int
 
 
-def find_enclosing_scope(tree: Tree, line: int, language: Language) -> Scope | None:  # noqa: PLR0911
+_ScopeFinder = Callable[["Tree", int], "Scope | None"]
+
+
+@lru_cache(maxsize=1)
+def _scope_finders() -> dict[Language, _ScopeFinder]:
+    """Build the language -> scope finder dispatch table.
+
+    The language modules import ``Scope`` from this module, so they are
+    imported here on first use rather than at module load.
+    """
+    from diffguard.ast.elixir import find_elixir_scope  # noqa: PLC0415
+    from diffguard.ast.go import find_go_scope  # noqa: PLC0415
+    from diffguard.ast.java import find_java_scope  # noqa: PLC0415
+    from diffguard.ast.javascript import find_javascript_scope  # noqa: PLC0415
+    from diffguard.ast.php import find_php_scope  # noqa: PLC0415
+    from diffguard.ast.python import find_python_scope  # noqa: PLC0415
+    from diffguard.ast.ruby import find_ruby_scope  # noqa: PLC0415
+    from diffguard.ast.typescript import find_typescript_scope  # noqa: PLC0415
+
+    return {
+        Language.PYTHON: find_python_scope,
+        Language.JAVASCRIPT: find_javascript_scope,
+        Language.TYPESCRIPT: find_typescript_scope,
+        Language.JAVA: find_java_scope,
+        Language.RUBY: find_ruby_scope,
+        Language.GO: find_go_scope,
+        Language.PHP: find_php_scope,
+        Language.ELIXIR: find_elixir_scope,
+    }
+
+
+def find_enclosing_scope(tree: Tree, line: int, language: Language) -> Scope | None:
     """Find the innermost scope containing a 1-indexed line number.
 
     Args:
@@ -38,41 +71,10 @@ def find_enclosing_scope(tree: Tree, line: int, language: Language) -> Scope | N
     if line < 1:
         return None
 
-    match language:
-        case Language.PYTHON:
-            from diffguard.ast.python import find_python_scope  # noqa: PLC0415
-
-            return find_python_scope(tree, line)
-        case Language.JAVASCRIPT:
-            from diffguard.ast.javascript import find_javascript_scope  # noqa: PLC0415
-
-            return find_javascript_scope(tree, line)
-        case Language.TYPESCRIPT:
-            from diffguard.ast.typescript import find_typescript_scope  # noqa: PLC0415
-
-            return find_typescript_scope(tree, line)
-        case Language.JAVA:
-            from diffguard.ast.java import find_java_scope  # noqa: PLC0415
-
-            return find_java_scope(tree, line)
-        case Language.RUBY:
-            from diffguard.ast.ruby import find_ruby_scope  # noqa: PLC0415
-
-            return find_ruby_scope(tree, line)
-        case Language.GO:
-            from diffguard.ast.go import find_go_scope  # noqa: PLC0415
-
-            return find_go_scope(tree, line)
-        case Language.PHP:
-            from diffguard.ast.php import find_php_scope  # noqa: PLC0415
-
-            return find_php_scope(tree, line)
-        case Language.ELIXIR:
-            from diffguard.ast.elixir import find_elixir_scope  # noqa: PLC0415
-
-            return find_elixir_scope(tree, line)
-        case _:
-            return None
+    finder = _scope_finders().get(language)
+    if finder is None:
+        return None
+    return finder(tree, line)
 
 
 def extract_scope_context(
@@ -95,12 +97,12 @@ def extract_scope_context(
     """
     start_idx = max(0, scope.start_line - 1)
     end_idx = min(len(source_lines), scope.end_line)
-    scope_lines = source_lines[start_idx:end_idx]
-    total = len(scope_lines)
+    total = max(0, end_idx - start_idx)
 
     if is_new_file or total <= limit:
-        return "\n".join(scope_lines)
+        return "\n".join(source_lines[start_idx:end_idx])
 
+    # Slice only the kept lines rather than copying the whole scope first
     truncated_count = total - limit
-    kept = scope_lines[:limit]
+    kept = source_lines[start_idx : start_idx + limit]
     return "\n".join(kept) + f"\n... [truncated {truncated_count} lines]"
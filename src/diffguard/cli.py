@@ -20,7 +20,7 @@ from diffguard.baseline_cli import baseline_app
 from diffguard.config import DiffguardConfig, load_config
 from diffguard.exceptions import BaselineError, ConfigError, DiffguardError, GitError, ReportWriteError
 from diffguard.git import DiffFile, get_branch_name, get_commit_hash, get_staged_diff, is_git_repo, parse_diff
-from diffguard.llm import SYSTEM_PROMPT, AnalysisResult, OpenAIClient, build_user_prompt, estimate_tokens
+from diffguard.llm import SYSTEM_PROMPT, AnalysisResult, LLMClient, build_user_prompt, estimate_tokens
 from diffguard.llm.analyzer import FileAnalysisError, analyze_files
 from diffguard.llm.response import Finding  # noqa: TC001
 from diffguard.output.json_report import ReportMetadata, generate_report, print_report, write_report
@@ -350,7 +350,7 @@ def main(
 
 async def _run_verbose_analysis(
     prepared: PreparedContext,
-    client: OpenAIClient,
+    client: LLMClient,
     config: DiffguardConfig,
     *,
     json_output: bool,
@@ -414,7 +414,7 @@ async def _run_verbose_analysis(
 async def _run_default_analysis(
     diff_files: list[DiffFile],
     config: DiffguardConfig,
-    client: OpenAIClient,
+    client: LLMClient,
     console: Console,
     *,
     analyzed_count: int,
@@ -467,6 +467,9 @@ async def _run(
         _handle_dry_run(prepared, staged_files=staged_files, verbose=verbose, json_output=json_output, output=output)
         return  # _handle_dry_run raises typer.Exit, but guard return for clarity
 
+    # Deferred so commands that never reach the API skip loading the openai SDK
+    from diffguard.llm.client import OpenAIClient  # noqa: PLC0415
+
     client = OpenAIClient(model=config.model, timeout=config.timeout, temperature=config.temperature)
 
     try:
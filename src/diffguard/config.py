@@ -1,7 +1,9 @@
 """Configuration management for Diffguard."""
 
+import os
 import tomllib
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
@@ -14,6 +16,9 @@ CONFIG_FILENAME = ".diffguard.toml"
 
 _VALID_THRESHOLD_ACTIONS = ("block", "warn", "allow")
 
+# Resolved start directory -> config file path, memoized across lookups
+_config_path_cache: dict[str, str] = {}
+
 
 class ThresholdAction(Enum):
     """Action to take when a finding meets or exceeds a severity threshold."""
@@ -60,7 +65,8 @@ def _parse_min_confidence(data: dict[str, object]) -> dict[str, object]:
 class DiffguardConfig(BaseModel):
     """Configuration for Diffguard security analysis."""
 
-    model_config = ConfigDict(extra="ignore", frozen=True)
+    # Defer schema construction from import time to the first instantiation
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True)
 
     # Context building settings
     hunk_expansion_lines: int = Field(default=50, ge=0, description="Number of lines to expand around each hunk")
@@ -103,8 +109,8 @@ class DiffguardConfig(BaseModel):
     )
 
     # Sensitive file exclusion
-    sensitive_patterns: list[str] = Field(
-        default_factory=list, description="Additional glob patterns for sensitive file exclusion"
+    sensitive_patterns: tuple[str, ...] = Field(
+        default=(), description="Additional glob patterns for sensitive file exclusion"
     )
     use_default_sensitive_patterns: bool = Field(
         default=True, description="Whether to include built-in sensitive file patterns"
@@ -195,9 +201,27 @@ class DiffguardConfig(BaseModel):
         return self
 
 
+_DEFAULT_CONFIG: DiffguardConfig | None = None
+
+
+def get_default_config() -> DiffguardConfig:
+    """Return a shared default config, validated once on first use.
+
+    The model is frozen, so one instance can serve every caller that needs defaults.
+    """
+    global _DEFAULT_CONFIG  # noqa: PLW0603
+    if _DEFAULT_CONFIG is None:
+        _DEFAULT_CONFIG = DiffguardConfig()
+    return _DEFAULT_CONFIG
+
+
 def find_config_file(start_path: Path | None = None) -> Path | None:
     """Find .diffguard.toml by walking up the directory tree.
 
+    Found paths are memoized per resolved start directory; call
+    ``clear_config_cache()`` after moving or removing config files. A miss
+    is not memoized, so a config file created later is picked up.
+
     Args:
         start_path: Starting directory. Defaults to current working directory.
 
@@ -207,20 +231,31 @@ def find_config_file(start_path: Path | None = None) -> Path | None:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
+    start = str(start_path.resolve())
+    cached = _config_path_cache.get(start)
+    if cached is not None:
+        return Path(cached)
 
+    current = start
     while True:
-        config_path = current / CONFIG_FILENAME
-        if config_path.exists():
-            return config_path
+        candidate = os.path.join(current, CONFIG_FILENAME)  # noqa: PTH118
+        if os.path.exists(candidate):  # noqa: PTH110
+            _config_path_cache[start] = candidate
+            return Path(candidate)
 
-        parent = current.parent
+        parent = os.path.dirname(current)  # noqa: PTH120
         if parent == current:
             # Reached filesystem root
             return None
         current = parent
 
 
+def clear_config_cache() -> None:
+    """Clear the memoized config file lookups and parsed config files."""
+    _config_path_cache.clear()
+    _load_config_cached.cache_clear()
+
+
 def load_config(config_path: Path | None = None, start_path: Path | None = None) -> DiffguardConfig:
     """Load configuration from .diffguard.toml file.
 
@@ -239,28 +274,45 @@ def load_config(config_path: Path | None = None, start_path: Path | None = None)
         config_path = find_config_file(start_path)
 
     if config_path is None:
-        return DiffguardConfig()
+        return get_default_config()
 
     try:
-        content = config_path.read_text(encoding="utf-8")
+        stat = config_path.stat()
+    except OSError:
+        # Let the uncached path report the read error
+        return _load_config_file(config_path)
+
+    return _load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> DiffguardConfig:  # noqa: ARG001
+    """Load a config file, memoized on its path, modification time and size.
+
+    Editing the file changes the key, so stale entries are never returned.
+    Failed loads raise and are therefore not cached.
+    """
+    return _load_config_file(Path(path))
+
+
+def _load_config_file(config_path: Path) -> DiffguardConfig:
+    """Read, parse and validate a config file."""
+    try:
+        with config_path.open("rb") as f:
+            data = tomllib.load(f)
     except PermissionError as e:
         msg = f"Cannot read config file '{config_path}': permission denied"
         raise ConfigError(msg) from e
     except OSError as e:
         msg = f"Cannot read config file '{config_path}': {e}"
         raise ConfigError(msg) from e
-
-    if not content.strip():
-        return DiffguardConfig()
-
-    try:
-        data = tomllib.loads(content)
     except tomllib.TOMLDecodeError as e:
         msg = f"Invalid TOML in '{config_path}': {e}"
         raise ConfigError(msg) from e
 
+    # Empty and whitespace-only files parse to an empty table
     if not data:
-        return DiffguardConfig()
+        return get_default_config()
 
     try:
         return DiffguardConfig(**data)
@@ -10,13 +10,16 @@ from diffguard.exceptions import ContextError
 
 logger = logging.getLogger(__name__)
 
+# A NUL byte within this many leading bytes marks a file as binary
+_BINARY_SNIFF_BYTES = 8192
+
 if TYPE_CHECKING:
     from pathlib import Path
 
     from diffguard.git import DiffFile, DiffHunk
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Region:
     """A contiguous range of lines in a source file (1-indexed, inclusive)."""
 
@@ -40,13 +43,9 @@ def expand_hunk(hunk: DiffHunk, expansion: int, file_length: int | None = None)
     if file_length is not None and file_length <= 0:
         return Region(start_line=1, end_line=0)
 
-    hunk_start = hunk.new_start
-    hunk_end = hunk.new_start + max(hunk.new_count, 1) - 1
-
-    start = hunk_start - expansion
-    end = hunk_end + expansion
-
-    start = max(1, start)
+    # Deletion-only hunks (new_count 0) still anchor one line at new_start
+    start = max(1, hunk.new_start - expansion)
+    end = hunk.new_start + max(hunk.new_count, 1) - 1 + expansion
     if file_length is not None:
         end = min(file_length, end)
 
@@ -67,27 +66,30 @@ def merge_regions(regions: list[Region]) -> list[Region]:
     if len(regions) <= 1:
         return [Region(start_line=r.start_line, end_line=r.end_line) for r in regions]
 
-    sorted_regions = sorted(regions, key=lambda r: r.start_line)
-    merged: list[Region] = [Region(start_line=sorted_regions[0].start_line, end_line=sorted_regions[0].end_line)]
+    # Sweep over plain (start, end) pairs; Region objects are only built for the output
+    spans = sorted((r.start_line, r.end_line) for r in regions)
+    merged: list[Region] = []
+    current_start, current_end = spans[0]
 
-    for region in sorted_regions[1:]:
-        current = merged[-1]
-        if region.start_line <= current.end_line + 1:
-            current.end_line = max(current.end_line, region.end_line)
+    for start, end in spans[1:]:
+        if start <= current_end + 1:
+            current_end = max(current_end, end)
         else:
-            merged.append(Region(start_line=region.start_line, end_line=region.end_line))
+            merged.append(Region(start_line=current_start, end_line=current_end))
+            current_start, current_end = start, end
 
+    merged.append(Region(start_line=current_start, end_line=current_end))
     return merged
 
 
-def read_file_lines(path: Path) -> list[str]:
-    """Read a file and return its lines.
+def read_file_bytes(path: Path) -> bytes:
+    """Read a source file's raw content.
 
     Args:
         path: Path to the file to read.
 
     Returns:
-        List of lines (without line terminators).
+        The file content as bytes.
 
     Raises:
         ContextError: If the file does not exist or appears to be binary.
@@ -96,18 +98,62 @@ def read_file_lines(path: Path) -> list[str]:
         msg = f"File not found: {path}"
         raise ContextError(msg)
 
-    content = path.read_bytes()
+    with path.open("rb") as f:
+        # Sniff the first block before reading further, so large binaries are rejected early
+        head = f.read(_BINARY_SNIFF_BYTES)
+        if head.find(b"\x00") != -1:
+            msg = f"Binary file cannot be read as text: {path}"
+            raise ContextError(msg)
+        rest = f.read()
+
+    return head + rest if rest else head
 
-    if b"\x00" in content[:8192]:
-        msg = f"Binary file cannot be read as text: {path}"
-        raise ContextError(msg)
 
+def decode_source(content: bytes, path: Path) -> tuple[list[str], bytes]:
+    """Decode raw file content into lines, applying lossy decoding to malformed UTF-8.
+
+    Also returns the buffer to hand to the parser. That is ``content`` itself
+    when it decoded cleanly and its newlines give the same rows as the decoded
+    lines; otherwise the lines are re-joined, so the parser sees the replaced
+    text and tree rows line up with line indices.
+
+    Args:
+        content: Raw file content as returned by read_file_bytes().
+        path: Path the content was read from (used for logging).
+
+    Returns:
+        Tuple of (lines without line terminators, source bytes for parsing).
+    """
     try:
         text = content.decode("utf-8")
     except UnicodeDecodeError:
         logger.warning("File contains malformed UTF-8, lossy decoding applied: %s", path)
-        text = content.decode("utf-8", errors="replace")
-    return text.splitlines()
+        lines = content.decode("utf-8", errors="replace").splitlines()
+        return lines, "\n".join(lines).encode("utf-8")
+
+    lines = text.splitlines()
+    # Tree-sitter only counts "\n" as a row break; splitlines() also breaks on
+    # "\r", "\f", "\v" and Unicode separators
+    rows = content.count(b"\n") + (not content.endswith(b"\n") and bool(content))
+    if len(lines) != rows:
+        return lines, "\n".join(lines).encode("utf-8")
+    return lines, content
+
+
+def read_file_lines(path: Path) -> list[str]:
+    """Read a file and return its lines.
+
+    Args:
+        path: Path to the file to read.
+
+    Returns:
+        List of lines (without line terminators).
+
+    Raises:
+        ContextError: If the file does not exist or appears to be binary.
+    """
+    lines, _ = decode_source(read_file_bytes(path), path)
+    return lines
 
 
 def build_file_regions(diff_file: DiffFile, file_length: int, expansion: int) -> list[Region]:
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from diffguard.ast.languages import Language
-from diffguard.config import DiffguardConfig
+from diffguard.config import DiffguardConfig, get_default_config
 
 if TYPE_CHECKING:
     from diffguard.git import DiffFile
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 # Comprehensive default patterns from PRD section 3.6.1.
 # Patterns without "/" match against the filename (basename) only.
 # Patterns with "/" match against the full path.
-DEFAULT_SENSITIVE_PATTERNS: list[str] = [
+DEFAULT_SENSITIVE_PATTERNS: tuple[str, ...] = (
     # ── Environment & Secrets Files ──
     ".env",
     ".env.*",
@@ -109,7 +110,7 @@ DEFAULT_SENSITIVE_PATTERNS: list[str] = [
     "authinfo",
     ".authinfo",
     ".netrc",
-]
+)
 
 
 @dataclass
@@ -120,45 +121,118 @@ class FilterResult:
     excluded: list[tuple[str, str]] = field(default_factory=list)
 
 
-def _get_effective_patterns(config: DiffguardConfig) -> list[str]:
-    """Build the effective list of sensitive file patterns from config."""
-    patterns: list[str] = []
-    if config.use_default_sensitive_patterns:
-        patterns.extend(DEFAULT_SENSITIVE_PATTERNS)
-    patterns.extend(config.sensitive_patterns)
-    return patterns
+def _get_effective_patterns(config: DiffguardConfig) -> tuple[tuple[str, ...], _PatternIndex]:
+    """Return the effective sensitive file patterns for a config and their index.
+
+    The cache is keyed on the config's own (already immutable) fields, so a
+    lookup neither copies nor hashes the combined default pattern list.
+    """
+    return _build_effective_patterns(config.use_default_sensitive_patterns, config.sensitive_patterns)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_effective_patterns(use_defaults: bool, extra: tuple[str, ...]) -> tuple[tuple[str, ...], _PatternIndex]:
+    """Combine the default and user-supplied patterns (cached per distinct combination)."""
+    patterns = (*DEFAULT_SENSITIVE_PATTERNS, *extra) if use_defaults else extra
+    return patterns, _build_pattern_index(patterns)
 
 
-def _matches_pattern(file_path: str, pattern: str) -> bool:
-    """Check if a file path matches a single glob pattern (case-insensitive).
+def _matches_pattern(path_lower: str, basename: str, pattern_lower: str) -> bool:
+    """Check if a lowercased path matches a single lowercased glob pattern.
 
     Patterns containing "/" are matched against the full path.
     Patterns without "/" are matched against the basename only.
+    Callers lowercase the path and split off its basename once per file.
 
     Note: Uses fnmatch, where ``*`` matches everything including ``/``.
     The ``**`` glob syntax is not distinctly supported — ``**`` behaves
     identically to ``*``.  This is acceptable because basename-only
     matching already handles the common deep-path cases.
     """
-    path_lower = file_path.lower()
-    pattern_lower = pattern.lower()
-
-    if "/" in pattern:
+    if "/" in pattern_lower:
         return fnmatch.fnmatch(path_lower, pattern_lower) or fnmatch.fnmatch(path_lower, "*/" + pattern_lower)
 
-    basename = path_lower.rsplit("/", 1)[-1]
     return fnmatch.fnmatch(basename, pattern_lower)
 
 
-_DEFAULT_CONFIG: DiffguardConfig | None = None
+def _basename(path: str) -> str:
+    """Return the last "/"-separated component of a path."""
+    return path[path.rfind("/") + 1 :]
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class _PatternIndex:
+    """Sensitive patterns partitioned by how cheaply they can be matched.
+
+    All members are lowercased; inputs must be lowercased as well.
+    """
+
+    # Basename patterns without wildcards (``id_rsa``) — set lookup
+    basenames: frozenset[str]
+    # Literal tails of ``*<literal>`` basename patterns (``.pem``) — str.endswith
+    basename_suffixes: tuple[str, ...]
+    # Path patterns without wildcards (``.aws/credentials``) — whole path or "/"-prefixed path suffix
+    paths: frozenset[str]
+    path_suffixes: tuple[str, ...]
+    # Remaining wildcard globs, each group joined into one alternation regex
+    basename_re: re.Pattern[str] | None
+    path_re: re.Pattern[str] | None
+    # Every pattern lowercased, in the original order (for reporting which one matched)
+    lowered: tuple[str, ...]
+
+    def matches(self, path_lower: str) -> bool:
+        """Check whether a lowercased path matches any indexed pattern."""
+        basename = _basename(path_lower)
+        if basename in self.basenames or basename.endswith(self.basename_suffixes):
+            return True
+        if path_lower in self.paths or path_lower.endswith(self.path_suffixes):
+            return True
+        if self.basename_re is not None and self.basename_re.match(basename):
+            return True
+        return self.path_re is not None and self.path_re.match(path_lower) is not None
+
 
+def _build_pattern_index(patterns: tuple[str, ...]) -> _PatternIndex:
+    """Partition sensitive patterns into literal lookups and combined glob regexes.
 
-def _get_default_config() -> DiffguardConfig:
-    """Return a lazily-initialised default config (avoids repeated Pydantic validation)."""
-    global _DEFAULT_CONFIG  # noqa: PLW0603
-    if _DEFAULT_CONFIG is None:
-        _DEFAULT_CONFIG = DiffguardConfig()
-    return _DEFAULT_CONFIG
+    Most patterns are plain names (``.npmrc``) or ``*.ext`` suffixes, which
+    reduce to a set lookup and a single ``str.endswith`` call. Only true
+    wildcard globs are translated with fnmatch and joined into one
+    alternation regex each for basename and full-path patterns.
+    """
+    basenames: set[str] = set()
+    basename_suffixes: list[str] = []
+    paths: set[str] = set()
+    basename_globs: list[str] = []
+    path_globs: list[str] = []
+
+    for pattern in patterns:
+        pattern_lower = pattern.lower()
+        if "/" in pattern_lower:
+            if _GLOB_CHARS.isdisjoint(pattern_lower):
+                paths.add(pattern_lower)
+            else:
+                path_globs.append(fnmatch.translate(pattern_lower))
+                path_globs.append(fnmatch.translate("*/" + pattern_lower))
+        elif _GLOB_CHARS.isdisjoint(pattern_lower):
+            basenames.add(pattern_lower)
+        elif pattern_lower.startswith("*") and _GLOB_CHARS.isdisjoint(pattern_lower[1:]):
+            basename_suffixes.append(pattern_lower[1:])
+        else:
+            basename_globs.append(fnmatch.translate(pattern_lower))
+
+    return _PatternIndex(
+        basenames=frozenset(basenames),
+        basename_suffixes=tuple(basename_suffixes),
+        paths=frozenset(paths),
+        path_suffixes=tuple("/" + path for path in paths),
+        basename_re=re.compile("|".join(basename_globs)) if basename_globs else None,
+        path_re=re.compile("|".join(path_globs)) if path_globs else None,
+        lowered=tuple(pattern.lower() for pattern in patterns),
+    )
 
 
 def is_sensitive_file(file_path: str, config: DiffguardConfig | None = None) -> bool:
@@ -172,10 +246,10 @@ def is_sensitive_file(file_path: str, config: DiffguardConfig | None = None) ->
         True if the file matches a sensitive pattern.
     """
     if config is None:
-        config = _get_default_config()
+        config = get_default_config()
 
-    patterns = _get_effective_patterns(config)
-    return any(_matches_pattern(file_path, pattern) for pattern in patterns)
+    _, index = _get_effective_patterns(config)
+    return index.matches(file_path.lower())
 
 
 def filter_sensitive_files(diff_files: list[DiffFile], config: DiffguardConfig) -> FilterResult:
@@ -188,27 +262,33 @@ def filter_sensitive_files(diff_files: list[DiffFile], config: DiffguardConfig)
     Returns:
         FilterResult with kept files and excluded (path, matched_pattern) pairs.
     """
-    result = FilterResult()
-    patterns = _get_effective_patterns(config)
-
-    for diff_file in diff_files:
-        path = diff_file.path
-        matched = _find_matching_pattern(path, patterns)
-        if matched is not None:
-            result.excluded.append((path, matched))
-        else:
-            result.kept.append(diff_file)
+    patterns, index = _get_effective_patterns(config)
+    matches = [_find_matching_pattern(diff_file.path, patterns, index) for diff_file in diff_files]
 
-    return result
+    return FilterResult(
+        kept=[diff_file for diff_file, matched in zip(diff_files, matches, strict=True) if matched is None],
+        excluded=[
+            (diff_file.path, matched)
+            for diff_file, matched in zip(diff_files, matches, strict=True)
+            if matched is not None
+        ],
+    )
 
 
-def _find_matching_pattern(file_path: str, patterns: list[str]) -> str | None:
+def _find_matching_pattern(file_path: str, patterns: tuple[str, ...], index: _PatternIndex) -> str | None:
     """Find the first matching sensitive pattern for a file path.
 
-    Returns the matched pattern string, or None if no match.
+    Returns the matched pattern string, or None if no match. The combined
+    regexes in ``index`` (built from ``patterns``) rule out non-matching paths
+    first; only a hit walks the individual patterns to report which one matched.
     """
-    for pattern in patterns:
-        if _matches_pattern(file_path, pattern):
+    path_lower = file_path.lower()
+    if not index.matches(path_lower):
+        return None
+
+    basename = _basename(path_lower)
+    for pattern, pattern_lower in zip(patterns, index.lowered, strict=True):
+        if _matches_pattern(path_lower, basename, pattern_lower):
             return pattern
     return None
 
@@ -218,6 +298,17 @@ def _find_matching_pattern(file_path: str, patterns: list[str]) -> str | None:
 # ---------------------------------------------------------------------------
 
 
+_MINIFIED_AVG_LINE_LENGTH = 500
+
+
+def _is_minified(source_lines: list[str]) -> bool:
+    """Check whether the average line length marks content as minified or bundled."""
+    if not source_lines:
+        return False
+    # map(len, ...) keeps the summation loop in C
+    return sum(map(len, source_lines)) / len(source_lines) > _MINIFIED_AVG_LINE_LENGTH
+
+
 def is_generated_file(file_path: str, source_lines: list[str], language: Language) -> bool:  # noqa: PLR0911, PLR0912
     """Check if a file is machine-generated or auto-created.
 
@@ -314,13 +405,7 @@ def _is_generated_typescript(file_path: str, source_lines: list[str]) -> bool:
                 return True
 
     # Content heuristic: avg line length > 500 chars indicates minified/bundled
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-
-    return False
+    return _is_minified(source_lines)
 
 
 _JAVA_GENERATED_PATH_SEGMENTS: tuple[str, ...] = (
@@ -456,53 +541,27 @@ def _is_generated_elixir(_file_path: str, source_lines: list[str]) -> bool:
             return True
 
     # Avg line length > 500 chars (minified/bundled — unlikely but consistent)
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-
-    return False
+    return _is_minified(source_lines)
 
 
 def _is_generated_html(source_lines: list[str]) -> bool:
     """Check if an HTML/template file is minified."""
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-    return False
+    return _is_minified(source_lines)
 
 
 def _is_generated_vue(source_lines: list[str]) -> bool:
     """Check if a Vue SFC is minified."""
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-    return False
+    return _is_minified(source_lines)
 
 
 def _is_generated_svelte(source_lines: list[str]) -> bool:
     """Check if a Svelte component is minified."""
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-    return False
+    return _is_minified(source_lines)
 
 
 def _is_generated_astro(source_lines: list[str]) -> bool:
     """Check if an Astro component is minified."""
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-    return False
+    return _is_minified(source_lines)
 
 
 def _is_generated_javascript(file_path: str, source_lines: list[str]) -> bool:
@@ -512,10 +571,4 @@ def _is_generated_javascript(file_path: str, source_lines: list[str]) -> bool:
         return True
 
     # Content heuristic: avg line length > 500 chars indicates minified code
-    if source_lines:
-        total_chars = sum(len(line) for line in source_lines)
-        avg_length = total_chars / len(source_lines)
-        if avg_length > 500:
-            return True
-
-    return False
+    return _is_minified(source_lines)
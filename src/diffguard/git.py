@@ -1,30 +1,100 @@
 """Git diff parsing and extraction."""
 
+from __future__ import annotations
+
+import os
 import re
 import subprocess
+import sys
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from diffguard.exceptions import GitError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 _SUBPROCESS_TIMEOUT = 30
 
-HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+# core.quotePath=false keeps git from octal-escaping non-ASCII bytes in paths, so
+# C-quoted headers (and _parse_c_quoted) are only needed for paths containing
+# quotes, backslashes or control characters
+_STAGED_DIFF_COMMAND = ("git", "-c", "core.quotePath=false", "diff", "--cached")
+
+# Working directories already known to be inside a git work tree
+_git_repo_dirs: set[str] = set()
+
+HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", re.ASCII)
+
+# First characters of the lines that make up a hunk body
+_DIFF_BODY_PREFIXES = frozenset({" ", "+", "-"})
 
+# Longer paths are left uninterned so one huge diff cannot bloat the intern table
+_MAX_INTERNED_PATH_LENGTH = 256
 
-@dataclass
+
+@dataclass(slots=True, init=False)
 class DiffHunk:
-    """A single hunk from a unified diff."""
+    """A single hunk from a unified diff.
+
+    Body lines are stored column-wise: ``signs[i]`` is the marker byte
+    (``+``, ``-`` or space) and ``texts[i]`` the line content without it.
+    The constructor still accepts ``lines`` as ``(marker, content)`` pairs;
+    the ``lines`` property is a read-only view, so edits go to the columns.
+    """
 
     old_start: int
     old_count: int
     new_start: int
     new_count: int
-    lines: list[tuple[str, str]] = field(default_factory=list)
+    signs: bytearray
+    texts: list[str]
+
+    def __init__(
+        self,
+        old_start: int,
+        old_count: int,
+        new_start: int,
+        new_count: int,
+        lines: Iterable[tuple[str, str]] | None = None,
+        *,
+        signs: bytearray | None = None,
+        texts: list[str] | None = None,
+    ) -> None:
+        if lines is not None:
+            if signs is not None or texts is not None:
+                msg = "DiffHunk takes either lines or signs/texts, not both"
+                raise TypeError(msg)
+            pairs = list(lines)
+            signs = bytearray(ord(marker) for marker, _ in pairs)
+            texts = [content for _, content in pairs]
+        self.old_start = old_start
+        self.old_count = old_count
+        self.new_start = new_start
+        self.new_count = new_count
+        self.signs = bytearray() if signs is None else signs
+        self.texts = [] if texts is None else texts
+
+    @classmethod
+    def from_lines(
+        cls, old_start: int, old_count: int, new_start: int, new_count: int, lines: list[tuple[str, str]]
+    ) -> DiffHunk:
+        """Build a hunk from ``(marker, content)`` pairs."""
+        return cls(old_start, old_count, new_start, new_count, lines)
+
+    @property
+    def lines(self) -> tuple[tuple[str, str], ...]:
+        """Body lines as ``(marker, content)`` pairs."""
+        return tuple(zip(map(chr, self.signs), self.texts, strict=True))
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffFile:
-    """A single file's changes from a git diff."""
+    """A single file's changes from a git diff.
+
+    Paths shorter than _MAX_INTERNED_PATH_LENGTH are interned, so the copies
+    parsed from the header, ``---``/``+++`` and rename lines share one object.
+    """
 
     old_path: str
     new_path: str
@@ -43,12 +113,29 @@ class DiffFile:
         return self.new_path
 
 
+def _git_env() -> dict[str, str]:
+    """Environment for git subprocesses.
+
+    GIT_OPTIONAL_LOCKS=0 stops read-only commands from taking the index lock
+    to refresh stat information. Built per call so environment changes apply.
+    """
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
 def is_git_repo() -> bool:
     """Check if current directory is inside a git repository.
 
+    A positive answer is cached per working directory; call
+    ``clear_git_repo_cache()`` to force a fresh check. Negative answers are
+    not cached, so a repository created later (e.g. by ``git init``) is seen.
+
     Returns:
         True if inside a git repository, False otherwise.
     """
+    cwd = os.getcwd()  # noqa: PTH109
+    if cwd in _git_repo_dirs:
+        return True
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--is-inside-work-tree"],
@@ -56,11 +143,21 @@ def is_git_repo() -> bool:
             text=True,
             check=False,
             timeout=_SUBPROCESS_TIMEOUT,
+            env=_git_env(),
         )
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
+    if result.returncode != 0:
+        return False
+    _git_repo_dirs.add(cwd)
+    return True
+
+
+def clear_git_repo_cache() -> None:
+    """Clear the cached is_git_repo() answers (useful for testing)."""
+    _git_repo_dirs.clear()
+
 
 def get_staged_diff() -> str:
     """Get the staged diff from git.
@@ -73,10 +170,11 @@ def get_staged_diff() -> str:
     """
     try:
         result = subprocess.run(
-            ["git", "diff", "--cached"],
+            _STAGED_DIFF_COMMAND,
             capture_output=True,
             check=False,
             timeout=_SUBPROCESS_TIMEOUT,
+            env=_git_env(),
         )
     except FileNotFoundError as e:
         msg = "git is not installed or not in PATH"
@@ -105,6 +203,7 @@ def get_commit_hash() -> str | None:
             text=True,
             check=False,
             timeout=_SUBPROCESS_TIMEOUT,
+            env=_git_env(),
         )
         if result.returncode != 0:
             return None
@@ -126,6 +225,7 @@ def get_branch_name() -> str | None:
             text=True,
             check=False,
             timeout=_SUBPROCESS_TIMEOUT,
+            env=_git_env(),
         )
         if result.returncode != 0:
             return None
@@ -137,6 +237,13 @@ def get_branch_name() -> str | None:
         return None
 
 
+def _intern_path(path: str) -> str:
+    """Intern a parsed path unless it is unusually long."""
+    if len(path) < _MAX_INTERNED_PATH_LENGTH:
+        return sys.intern(path)
+    return path
+
+
 def _parse_diff_git_header(line: str) -> tuple[str, str]:
     """Parse 'diff --git a/... b/...' to extract old and new paths.
 
@@ -161,6 +268,12 @@ def _parse_diff_git_header(line: str) -> tuple[str, str]:
 
     # Unquoted: split on " b/"
     if rest.startswith("a/"):
+        # Unless the file was renamed, git emits the same path on both sides, so the
+        # separator sits exactly in the middle. This also picks the right split when
+        # the path itself contains " b/".
+        mid = (len(rest) - 1) // 2
+        if rest[mid : mid + 3] == " b/" and rest[2:mid] == rest[mid + 3 :]:
+            return rest[2:mid], rest[mid + 3 :]
         idx = rest.rfind(" b/")
         if idx != -1:
             return rest[2:idx], rest[idx + 3 :]
@@ -181,11 +294,23 @@ _C_ESCAPE_MAP: dict[str, str] = {
 }
 
 
+# A C-quoted body exactly as git writes it (named escapes and three-digit octal
+# byte escapes only), up to and including the closing quote
+_C_QUOTED_BODY_RE = re.compile(r'(?:[^"\\]|\\[\\"abfnrtv]|\\[0-3][0-7]{2})*"')
+
+# One token of a C-quoted string body: a run of plain characters, a named escape,
+# an octal escape, any other escaped character, the closing quote, or a lone
+# trailing backslash. Scanning token by token keeps the per-character loop in C.
+_C_QUOTED_TOKEN_RE = re.compile(r'([^"\\]+)|\\([\\"ntrabfv])|\\([0-7]{1,3})|\\(.)|(")|\\', re.DOTALL)
+
+
 def _parse_c_quoted(s: str) -> tuple[str, str]:
     """Parse a C-style quoted string, returning (unquoted_content, remainder).
 
     Handles standard C escape sequences (\\n, \\t, etc.) and octal escapes
-    (\\NNN) as used by git's C-style path quoting.
+    (\\NNN) as used by git's C-style path quoting. Octal escapes are the path's
+    raw bytes, so multi-byte sequences decode as UTF-8; invalid sequences are
+    replaced, as in the rest of the decoded diff.
     """
     if not s.startswith('"'):
         idx = s.find(" ")
@@ -193,34 +318,34 @@ def _parse_c_quoted(s: str) -> tuple[str, str]:
             return s, ""
         return s[:idx], s[idx + 1 :]
 
-    i = 1
-    result: list[str] = []
-    while i < len(s):
-        if s[i] == "\\" and i + 1 < len(s):
-            next_ch = s[i + 1]
-            if next_ch in _C_ESCAPE_MAP:
-                result.append(_C_ESCAPE_MAP[next_ch])
-                i += 2
-            elif next_ch.isdigit():
-                # Octal escape: up to 3 digits
-                octal = next_ch
-                for j in range(i + 2, min(i + 4, len(s))):
-                    if s[j].isdigit() and int(s[j]) < 8:
-                        octal += s[j]
-                    else:
-                        break
-                result.append(chr(int(octal, 8)))
-                i += 1 + len(octal)
-            else:
-                result.append(next_ch)
-                i += 2
-        elif s[i] == '"':
-            return "".join(result), s[i + 1 :]
+    # git escapes the raw bytes of the path, so the C codecs can undo every escape
+    # at once (unicode_escape maps each byte to the code point of the same value,
+    # which latin-1 turns back into bytes) and the bytes decode as UTF-8.
+    # Anything else takes the token scan, which collects the same bytes.
+    body = _C_QUOTED_BODY_RE.match(s, 1)
+    if body is not None:
+        raw = s[1 : body.end() - 1].encode().decode("unicode_escape").encode("latin-1")
+        return raw.decode(errors="replace"), s[body.end() :]
+
+    result = bytearray()
+    for match in _C_QUOTED_TOKEN_RE.finditer(s, 1):
+        literal, escape, octal, other, closing = match.groups()
+        if literal is not None:
+            result += literal.encode()
+        elif escape is not None:
+            result += _C_ESCAPE_MAP[escape].encode()
+        elif octal is not None:
+            # A byte escape; git never writes more than \377, so wrap like C would
+            result.append(int(octal, 8) & 0xFF)
+        elif other is not None:
+            result += other.encode()
+        elif closing is not None:
+            return result.decode(errors="replace"), s[match.end() :]
         else:
-            result.append(s[i])
-            i += 1
+            # Trailing lone backslash is kept as-is
+            result += b"\\"
 
-    return "".join(result), ""
+    return result.decode(errors="replace"), ""
 
 
 def _extract_path(raw: str, prefix: str) -> str | None:
@@ -240,39 +365,117 @@ def _extract_path(raw: str, prefix: str) -> str | None:
     return raw.rstrip()
 
 
-def _parse_hunk_header(hunk_match: re.Match[str]) -> DiffHunk:
-    """Create a DiffHunk from a hunk header regex match."""
-    old_start = int(hunk_match.group(1))
-    old_count = int(hunk_match.group(2)) if hunk_match.group(2) else 1
-    new_start = int(hunk_match.group(3))
-    new_count = int(hunk_match.group(4)) if hunk_match.group(4) else 1
-    return DiffHunk(old_start=old_start, old_count=old_count, new_start=new_start, new_count=new_count)
+def _parse_hunk_range(text: str) -> tuple[int, int] | None:
+    """Parse a hunk range ``start[,count]``; a missing count means 1.
 
+    Only ASCII digits are accepted, matching HUNK_HEADER_RE.
+    """
+    start, comma, count = text.partition(",")
+    if not (start.isascii() and start.isdecimal()):
+        return None
+    if not comma:
+        return int(start), 1
+    if not (count.isascii() and count.isdecimal()):
+        return None
+    return int(start), int(count)
 
-def _apply_metadata_line(line: str, diff_file: DiffFile) -> None:
-    """Apply a metadata line (file flags, paths) to a DiffFile."""
+
+def _parse_hunk_header(line: str) -> DiffHunk | None:
+    """Create a DiffHunk from an ``@@ -a[,b] +c[,d] @@`` header line.
+
+    Well-formed headers are split with plain string operations; anything
+    else falls back to HUNK_HEADER_RE. Returns None if the line is not a
+    valid hunk header.
+    """
+    end = line.find(" @@", 4)
+    if end != -1:
+        old_text, sep, new_text = line[4:end].partition(" +")
+        old_range = _parse_hunk_range(old_text) if sep else None
+        new_range = _parse_hunk_range(new_text) if sep else None
+        if old_range is not None and new_range is not None:
+            return DiffHunk(
+                old_start=old_range[0], old_count=old_range[1], new_start=new_range[0], new_count=new_range[1]
+            )
+
+    hunk_match = HUNK_HEADER_RE.match(line)
+    if hunk_match is None:
+        return None
+    return DiffHunk(
+        old_start=int(hunk_match.group(1)),
+        old_count=int(hunk_match.group(2)) if hunk_match.group(2) else 1,
+        new_start=int(hunk_match.group(3)),
+        new_count=int(hunk_match.group(4)) if hunk_match.group(4) else 1,
+    )
+
+
+def _apply_new_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "new file mode" and "new mode" lines."""
     if line.startswith("new file mode"):
         diff_file.is_new_file = True
-    elif line.startswith("deleted file mode"):
+    elif line.startswith("new mode "):
+        diff_file.mode_changed = True
+
+
+def _apply_deleted_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "deleted file mode" lines."""
+    if line.startswith("deleted file mode"):
         diff_file.is_deleted = True
-    elif line.startswith("old mode ") or line.startswith("new mode "):
+
+
+def _apply_old_mode_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "old mode" lines."""
+    if line.startswith("old mode "):
         diff_file.mode_changed = True
-    elif line.startswith("rename from "):
-        diff_file.old_path = line[len("rename from ") :]
+
+
+def _apply_rename_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "rename from" and "rename to" lines."""
+    if line.startswith("rename from "):
+        diff_file.old_path = _intern_path(line[len("rename from ") :])
         diff_file.is_renamed = True
     elif line.startswith("rename to "):
-        diff_file.new_path = line[len("rename to ") :]
+        diff_file.new_path = _intern_path(line[len("rename to ") :])
         diff_file.is_renamed = True
-    elif line.startswith("Binary files"):
+
+
+def _apply_binary_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "Binary files ... differ" lines."""
+    if line.startswith("Binary files"):
         diff_file.is_binary = True
-    elif line.startswith("--- "):
-        path = _extract_path(line[4:], "a/")
-        if path is not None:
-            diff_file.old_path = path
-    elif line.startswith("+++ "):
-        path = _extract_path(line[4:], "b/")
-        if path is not None:
-            diff_file.new_path = path
+
+
+def _apply_old_path_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "--- a/..." lines."""
+    path = _extract_path(line[4:], "a/")
+    if path is not None:
+        diff_file.old_path = _intern_path(path)
+
+
+def _apply_new_path_line(line: str, diff_file: DiffFile) -> None:
+    """Handle "+++ b/..." lines."""
+    path = _extract_path(line[4:], "b/")
+    if path is not None:
+        diff_file.new_path = _intern_path(path)
+
+
+# Metadata handlers keyed by the first four characters of the line. Each handler
+# still checks its full prefix, since several lines share a four-character key.
+_METADATA_HANDLERS: dict[str, Callable[[str, DiffFile], None]] = {
+    "new ": _apply_new_line,
+    "dele": _apply_deleted_line,
+    "old ": _apply_old_mode_line,
+    "rena": _apply_rename_line,
+    "Bina": _apply_binary_line,
+    "--- ": _apply_old_path_line,
+    "+++ ": _apply_new_path_line,
+}
+
+
+def _apply_metadata_line(line: str, diff_file: DiffFile) -> None:
+    """Apply a metadata line (file flags, paths) to a DiffFile."""
+    handler = _METADATA_HANDLERS.get(line[:4])
+    if handler is not None:
+        handler(line, diff_file)
 
 
 def parse_diff(diff_string: str) -> list[DiffFile]:
@@ -284,20 +487,51 @@ def parse_diff(diff_string: str) -> list[DiffFile]:
     Returns:
         List of DiffFile objects representing each changed file.
     """
-    if not diff_string or not diff_string.strip():
+    # isspace() stops at the first non-whitespace character, unlike strip(), which
+    # would copy nearly the whole diff just to test it for emptiness
+    if not diff_string or diff_string.isspace():
         return []
 
-    files: list[DiffFile] = []
+    return parse_diff_lines(diff_string.split("\n"))
+
+
+def parse_diff_lines(lines: Iterable[str]) -> list[DiffFile]:
+    """Parse unified diff lines (without line terminators) into DiffFile objects.
+
+    Args:
+        lines: Lines of a unified diff, e.g. from ``str.split("\\n")``.
+
+    Returns:
+        List of DiffFile objects representing each changed file.
+    """
+    return list(iter_diff_files(lines))
+
+
+def iter_diff_files(lines: Iterable[str]) -> Iterator[DiffFile]:
+    """Parse unified diff lines lazily, yielding each DiffFile once it is complete.
+
+    Accepts any iterable, and a consumer that handles one file at a time
+    only keeps that file in memory.
+
+    Args:
+        lines: Lines of a unified diff, without line terminators.
+
+    Yields:
+        DiffFile objects in diff order.
+    """
     current_file: DiffFile | None = None
     current_hunk: DiffHunk | None = None
+    # Bound appenders for the current hunk's columns, hoisted out of the per-line path
+    append_sign: Callable[[int], None] = bytearray().append
+    append_text: Callable[[str], None] = list[str]().append
 
-    for line in diff_string.split("\n"):
+    for line in lines:
         # New file diff header — highest priority
         if line.startswith("diff --git "):
             if current_file is not None:
-                files.append(current_file)
+                yield current_file
             old_path, new_path = _parse_diff_git_header(line)
-            current_file = DiffFile(old_path=old_path, new_path=new_path)
+            current_file = DiffFile(old_path=_intern_path(old_path), new_path=_intern_path(new_path))
             current_hunk = None
             continue
 
@@ -305,25 +539,33 @@ def parse_diff(diff_string: str) -> list[DiffFile]:
             continue
 
         # Inside a hunk: consume diff lines before checking metadata
-        if current_hunk is not None and line and line[0] in (" ", "+", "-"):
-            current_hunk.lines.append((line[0], line[1:]))
+        if current_hunk is not None and line and line[0] in _DIFF_BODY_PREFIXES:
+            append_sign(ord(line[0]))
+            append_text(line[1:])
             continue
 
         # No-newline marker
         if line.startswith("\\"):
             continue
 
-        # Hunk header
-        hunk_match = HUNK_HEADER_RE.match(line)
-        if hunk_match:
-            current_hunk = _parse_hunk_header(hunk_match)
-            current_file.hunks.append(current_hunk)
-            continue
+        # Hunk header — only lines with the "@@ -" prefix can be one
+        if line.startswith("@@ -"):
+            hunk = _parse_hunk_header(line)
+            if hunk is not None:
+                current_hunk = hunk
+                current_file.hunks.append(current_hunk)
+                append_sign = hunk.signs.append
+                append_text = hunk.texts.append
+                continue
 
         # Metadata lines (file flags, paths, binary markers)
         _apply_metadata_line(line, current_file)
 
-    if current_file is not None:
-        files.append(current_file)
+        # "Binary files ... differ" is the last line git emits for a binary file:
+        # close it so the remaining lines skip straight to the next diff header
+        if current_file.is_binary and current_hunk is None:
+            yield current_file
+            current_file = None
 
-    return files
+    if current_file is not None:
+        yield current_file
@@ -1,5 +1,7 @@
 """LLM integration for Diffguard security analysis."""
 
+from typing import TYPE_CHECKING
+
 from diffguard.llm.analyzer import (
     AnalysisResult,
     FileAnalysisError,
@@ -7,7 +9,6 @@ from diffguard.llm.analyzer import (
     analyze_file,
     analyze_files,
 )
-from diffguard.llm.client import OpenAIClient
 from diffguard.llm.prompts import (
     SYSTEM_PROMPT,
     CodeContext,
@@ -28,6 +29,9 @@ from diffguard.llm.tokens import (
     estimate_cost,
 )
 
+if TYPE_CHECKING:
+    from diffguard.llm.client import OpenAIClient
+
 __all__ = [
     "SYSTEM_PROMPT",
     "AnalysisResult",
@@ -49,3 +53,17 @@ __all__ = [
     "estimate_tokens",
     "parse_llm_response",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import OpenAIClient on first access.
+
+    The openai SDK dominates import time, and most modules that pull in this
+    package (e.g. diffguard.config for the response enums) never create a client.
+    """
+    if name == "OpenAIClient":
+        from diffguard.llm.client import OpenAIClient  # noqa: PLC0415
+
+        return OpenAIClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
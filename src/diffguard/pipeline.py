@@ -22,7 +22,7 @@ from diffguard.ast import (
 from diffguard.ast.astro import detect_astro_frontmatter_language, extract_astro_frontmatter
 from diffguard.ast.svelte import detect_svelte_script_language, extract_svelte_script
 from diffguard.ast.vue import detect_vue_script_language, extract_vue_script
-from diffguard.context import Region, build_file_regions, read_file_lines
+from diffguard.context import Region, build_file_regions, decode_source, read_file_bytes, read_file_lines
 from diffguard.exceptions import ContextError, UnsupportedLanguageError
 from diffguard.exclusions import filter_sensitive_files, is_generated_file
 from diffguard.llm import (
@@ -337,7 +337,7 @@ def _build_file_context(
         OSError: If filesystem operations fail.
     """
     file_path = project_root / diff_file.path
-    source_lines = read_file_lines(file_path)
+    source_lines, content = decode_source(read_file_bytes(file_path), file_path)
     regions = build_file_regions(diff_file, len(source_lines), config.hunk_expansion_lines)
     diff_lines = _build_diff_lines(diff_file)
 
@@ -360,8 +360,7 @@ def _build_file_context(
         # Parse AST — catch UnsupportedLanguageError so file continues without AST
         tree: Tree | None = None
         try:
-            source_text = "\n".join(source_lines)
-            tree = parse_file(source_text, language)
+            tree = parse_file(content, language)
         except UnsupportedLanguageError:
             logger.debug("No grammar for %s, skipping AST analysis: %s", language.name, diff_file.path)
 
@@ -595,6 +594,12 @@ def _build_astro_context(
     return scopes, symbols
 
 
+# DiffHunk.signs holds marker bytes
+_SIGN_ADDED = ord("+")
+_SIGN_REMOVED = ord("-")
+_SIGN_CONTEXT = ord(" ")
+
+
 def _build_diff_lines(diff_file: DiffFile) -> list[DiffLine]:
     """Build DiffLine list from hunk lines, tracking new-file line numbers.
 
@@ -604,16 +609,15 @@ def _build_diff_lines(diff_file: DiffFile) -> list[DiffLine]:
     result: list[DiffLine] = []
     for hunk in diff_file.hunks:
         line_num = hunk.new_start
-        for marker, content in hunk.lines:
-            match marker:
-                case "+":
-                    result.append(DiffLine(line_num=line_num, change_type="+", content=content))
-                    line_num += 1
-                case "-":
-                    result.append(DiffLine(line_num=line_num, change_type="-", content=content))
-                case " ":
-                    result.append(DiffLine(line_num=line_num, change_type=" ", content=content))
-                    line_num += 1
+        for sign, content in zip(hunk.signs, hunk.texts, strict=True):
+            if sign == _SIGN_ADDED:
+                result.append(DiffLine(line_num=line_num, change_type="+", content=content))
+                line_num += 1
+            elif sign == _SIGN_REMOVED:
+                result.append(DiffLine(line_num=line_num, change_type="-", content=content))
+            elif sign == _SIGN_CONTEXT:
+                result.append(DiffLine(line_num=line_num, change_type=" ", content=content))
+                line_num += 1
     return result
 
 
@@ -680,9 +684,8 @@ def _build_symbols(
             if not is_first_party(str(resolved_path), project_root, config.third_party_patterns, language):
                 continue
 
-            resolved_lines = read_file_lines(resolved_path)
-            resolved_source = "\n".join(resolved_lines)
-            resolved_tree = parse_file(resolved_source, language)
+            resolved_lines, resolved_content = decode_source(read_file_bytes(resolved_path), resolved_path)
+            resolved_tree = parse_file(resolved_content, language)
             if resolved_tree is None:
                 continue
 
@@ -2,8 +2,16 @@
 
 import pytest
 
+from diffguard.ast import Language, get_parser
 
-@pytest.fixture
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_python_parser() -> None:
+    """Load the Python grammar once so individual tests do not pay for it."""
+    get_parser(Language.PYTHON)
+
+
+@pytest.fixture(scope="module")
 def sample_valid_config_toml() -> str:
     """Return valid TOML config string."""
     return """
@@ -14,7 +22,7 @@ max_concurrent_api_calls = 10
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_partial_config_toml() -> str:
     """Return TOML config with only some fields."""
     return """
@@ -22,7 +30,7 @@ model = "gpt-4o"
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_invalid_syntax_toml() -> str:
     """Return TOML with invalid syntax."""
     return """
@@ -30,7 +38,7 @@ key = "unclosed string
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_negative_value_toml() -> str:
     """Return TOML with negative value for positive-only field."""
     return """
@@ -38,7 +46,7 @@ hunk_expansion_lines = -5
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_wrong_type_toml() -> str:
     """Return TOML with wrong type for a field."""
     return """
@@ -46,7 +54,7 @@ hunk_expansion_lines = "fifty"
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_unknown_field_toml() -> str:
     """Return TOML with unknown field."""
     return """
@@ -54,7 +62,7 @@ unknown_field = "value"
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_comments_only_toml() -> str:
     """Return TOML with only comments."""
     return """
@@ -27,7 +27,7 @@ runner = CliRunner()
 # ---------------------------------------------------------------------------
 # Patch targets (only LLM + git metadata)
 # ---------------------------------------------------------------------------
-_CLIENT = "diffguard.cli.OpenAIClient"
+_CLIENT = "diffguard.llm.client.OpenAIClient"
 _COMMIT = "diffguard.cli.get_commit_hash"
 _BRANCH = "diffguard.cli.get_branch_name"
 
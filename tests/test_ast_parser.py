@@ -1,12 +1,19 @@
 """Tests for tree-sitter integration: language detection, parser caching, and file parsing."""
 
+from __future__ import annotations
+
 import logging
+import threading
+from typing import TYPE_CHECKING
 
 import pytest
 
-from diffguard.ast import Language, clear_parser_cache, detect_language, get_parser, parse_file
+from diffguard.ast import Language, clear_parse_cache, clear_parser_cache, detect_language, get_parser, parse_file
 from diffguard.exceptions import UnsupportedLanguageError
 
+if TYPE_CHECKING:
+    from tree_sitter import Tree
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -40,6 +47,33 @@ def grüße(名前: str) -> str:
 """
 
 
+# Each source is parsed once per module and shared by the tests that only inspect the tree
+
+
+@pytest.fixture(scope="module")
+def valid_tree() -> Tree | None:
+    """Parse VALID_PYTHON."""
+    return parse_file(VALID_PYTHON, Language.PYTHON)
+
+
+@pytest.fixture(scope="module")
+def syntax_error_tree() -> Tree | None:
+    """Parse SYNTAX_ERROR_PYTHON."""
+    return parse_file(SYNTAX_ERROR_PYTHON, Language.PYTHON)
+
+
+@pytest.fixture(scope="module")
+def unicode_tree() -> Tree | None:
+    """Parse UNICODE_PYTHON."""
+    return parse_file(UNICODE_PYTHON, Language.PYTHON)
+
+
+@pytest.fixture(scope="module")
+def comments_only_tree() -> Tree | None:
+    """Parse COMMENTS_ONLY_PYTHON."""
+    return parse_file(COMMENTS_ONLY_PYTHON, Language.PYTHON)
+
+
 # ---------------------------------------------------------------------------
 # TestParseFile
 # ---------------------------------------------------------------------------
@@ -48,46 +82,37 @@ def grüße(名前: str) -> str:
 class TestParseFile:
     """Test parse_file() for valid, malformed, empty, and edge-case sources."""
 
-    def test_valid_python_produces_module_root(self) -> None:
+    def test_valid_python_produces_module_root(self, valid_tree: Tree | None) -> None:
         """Valid Python source produces a tree with root node type 'module'."""
-        tree = parse_file(VALID_PYTHON, Language.PYTHON)
-        assert tree is not None
-        assert tree.root_node.type == "module"
+        assert valid_tree is not None
+        assert valid_tree.root_node.type == "module"
 
-    def test_valid_python_has_children(self) -> None:
+    def test_valid_python_has_children(self, valid_tree: Tree | None) -> None:
         """Valid Python tree contains function and class definitions."""
-        tree = parse_file(VALID_PYTHON, Language.PYTHON)
-        assert tree is not None
-        child_types = [child.type for child in tree.root_node.named_children]
+        assert valid_tree is not None
+        child_types = [child.type for child in valid_tree.root_node.named_children]
         assert "function_definition" in child_types
         assert "class_definition" in child_types
 
-    def test_syntax_error_returns_tree_with_errors(self) -> None:
+    def test_syntax_error_returns_tree_with_errors(self, syntax_error_tree: Tree | None) -> None:
         """Source with syntax errors returns a tree (not None) containing ERROR nodes."""
-        tree = parse_file(SYNTAX_ERROR_PYTHON, Language.PYTHON)
-        assert tree is not None
-        assert tree.root_node.has_error
+        assert syntax_error_tree is not None
+        assert syntax_error_tree.root_node.has_error
 
-    def test_syntax_error_preserves_recoverable_structure(self) -> None:
+    def test_syntax_error_preserves_recoverable_structure(self, syntax_error_tree: Tree | None) -> None:
         """Partial parse preserves recoverable structure alongside errors."""
-        tree = parse_file(SYNTAX_ERROR_PYTHON, Language.PYTHON)
-        assert tree is not None
+        assert syntax_error_tree is not None
         # The parser should recover at least some named children that aren't ERROR
-        named_types = [child.type for child in tree.root_node.named_children]
+        named_types = [child.type for child in syntax_error_tree.root_node.named_children]
         non_error = [t for t in named_types if t != "ERROR"]
         assert len(non_error) > 0
 
-    def test_severely_malformed_returns_none(self) -> None:
-        """Severely malformed input (no recoverable structure) returns None."""
-        garbage = "}{}{][][))))(((({{{{}}}}>>><<<\x00\x01\x02\x03"
-        tree = parse_file(garbage, Language.PYTHON)
-        assert tree is None
-
-    def test_severely_malformed_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
-        """Severely malformed input logs a warning."""
+    def test_severely_malformed_returns_none_and_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Severely malformed input (no recoverable structure) returns None and logs a warning."""
         garbage = "}{}{][][))))(((({{{{}}}}>>><<<\x00\x01\x02\x03"
         with caplog.at_level(logging.WARNING, logger="diffguard.ast.parser"):
-            parse_file(garbage, Language.PYTHON)
+            tree = parse_file(garbage, Language.PYTHON)
+        assert tree is None
         assert any("malformed" in record.message.lower() for record in caplog.records)
 
     def test_empty_source_returns_valid_tree(self) -> None:
@@ -96,11 +121,10 @@ class TestParseFile:
         assert tree is not None
         assert tree.root_node.type == "module"
 
-    def test_comments_only_returns_valid_tree(self) -> None:
+    def test_comments_only_returns_valid_tree(self, comments_only_tree: Tree | None) -> None:
         """Source with only comments produces a valid tree."""
-        tree = parse_file(COMMENTS_ONLY_PYTHON, Language.PYTHON)
-        assert tree is not None
-        assert tree.root_node.type == "module"
+        assert comments_only_tree is not None
+        assert comments_only_tree.root_node.type == "module"
 
     def test_preserves_node_positions(self) -> None:
         """Parsed tree preserves byte offsets and line/column positions."""
@@ -115,15 +139,72 @@ class TestParseFile:
         assert func.start_byte == 0
         assert func.end_byte == len(source.encode("utf-8")) - 1  # excludes trailing newline
 
-    def test_unicode_source(self) -> None:
-        """Unicode identifiers and string content are parsed correctly."""
-        tree = parse_file(UNICODE_PYTHON, Language.PYTHON)
+    def test_bytes_source(self) -> None:
+        """UTF-8 encoded bytes parse to the same structure as text."""
+        tree = parse_file(UNICODE_PYTHON.encode("utf-8"), Language.PYTHON)
         assert tree is not None
-        assert tree.root_node.type == "module"
-        # The function definition should be parsed
         child_types = [child.type for child in tree.root_node.named_children]
         assert "function_definition" in child_types
 
+    def test_unicode_source(self, unicode_tree: Tree | None) -> None:
+        """Unicode identifiers and string content are parsed correctly."""
+        assert unicode_tree is not None
+        assert unicode_tree.root_node.type == "module"
+        # The function definition should be parsed
+        child_types = [child.type for child in unicode_tree.root_node.named_children]
+        assert "function_definition" in child_types
+
+
+# ---------------------------------------------------------------------------
+# TestParseCache
+# ---------------------------------------------------------------------------
+
+
+class TestParseCache:
+    """Test that parse_file() reuses trees for identical source content."""
+
+    def setup_method(self) -> None:
+        """Clear parse cache between tests."""
+        clear_parse_cache()
+
+    def test_identical_source_returns_cached_tree(self) -> None:
+        """Parsing the same source twice returns the same Tree instance."""
+        tree1 = parse_file(VALID_PYTHON, Language.PYTHON)
+        tree2 = parse_file(VALID_PYTHON, Language.PYTHON)
+        assert tree1 is not None
+        assert tree1 is tree2
+
+    def test_different_source_parsed_separately(self) -> None:
+        """Different source content produces distinct trees."""
+        tree1 = parse_file(VALID_PYTHON, Language.PYTHON)
+        tree2 = parse_file(UNICODE_PYTHON, Language.PYTHON)
+        assert tree1 is not tree2
+
+    def test_same_source_different_language_not_shared(self) -> None:
+        """The cache key includes the language."""
+        source = "x = 1;\n"
+        py_tree = parse_file(source, Language.PYTHON)
+        js_tree = parse_file(source, Language.JAVASCRIPT)
+        assert py_tree is not None
+        assert js_tree is not None
+        assert py_tree.root_node.type == "module"
+        assert js_tree.root_node.type == "program"
+
+    def test_clear_parse_cache_forces_reparse(self) -> None:
+        """clear_parse_cache() discards previously cached trees."""
+        tree1 = parse_file(VALID_PYTHON, Language.PYTHON)
+        clear_parse_cache()
+        tree2 = parse_file(VALID_PYTHON, Language.PYTHON)
+        assert tree1 is not tree2
+
+    def test_malformed_source_warns_on_every_call(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Cached malformed trees still return None and log a warning."""
+        garbage = "}{}{][][))))(((({{{{}}}}>>><<<\x00\x01\x02\x03"
+        parse_file(garbage, Language.PYTHON)
+        with caplog.at_level(logging.WARNING, logger="diffguard.ast.parser"):
+            assert parse_file(garbage, Language.PYTHON) is None
+        assert any("malformed" in record.message.lower() for record in caplog.records)
+
 
 # ---------------------------------------------------------------------------
 # TestDetectLanguage
@@ -161,6 +242,16 @@ class TestDetectLanguage:
         """Hidden file with known extension is detected."""
         assert detect_language(".hidden.py") == Language.PYTHON
 
+    def test_leading_dot_only_is_not_an_extension(self) -> None:
+        """A dotfile without a further suffix has no extension."""
+        assert detect_language(".py") is None
+        assert detect_language("src/.php") is None
+
+    def test_dot_in_directory_ignored(self) -> None:
+        """Dots in parent directories do not count as the file's extension."""
+        assert detect_language("pkg.py/README") is None
+        assert detect_language("build.d/Makefile") == Language.MAKEFILE
+
     def test_double_extension(self) -> None:
         """Double extension uses the last suffix."""
         assert detect_language("file.test.py") == Language.PYTHON
@@ -196,10 +287,6 @@ class TestDetectLanguage:
 class TestGetParser:
     """Test get_parser() caching and unsupported language errors."""
 
-    def setup_method(self) -> None:
-        """Clear parser cache between tests."""
-        clear_parser_cache()
-
     def test_returns_parser_for_python(self) -> None:
         """get_parser returns a working Parser for Python."""
         parser = get_parser(Language.PYTHON)
@@ -209,10 +296,22 @@ class TestGetParser:
 
     def test_cached_same_instance(self) -> None:
         """Repeated calls return the same Parser instance."""
+        clear_parser_cache()
         parser1 = get_parser(Language.PYTHON)
         parser2 = get_parser(Language.PYTHON)
         assert parser1 is parser2
 
+    def test_separate_instance_per_thread(self) -> None:
+        """Each thread gets its own Parser instance for the same language."""
+        main_parser = get_parser(Language.PYTHON)
+        other: list[object] = []
+        worker = threading.Thread(target=lambda: other.append(get_parser(Language.PYTHON)))
+        worker.start()
+        worker.join()
+        assert len(other) == 1
+        assert other[0] is not main_parser
+        assert get_parser(Language.PYTHON) is main_parser
+
     def test_returns_parser_for_javascript(self) -> None:
         """get_parser returns a working Parser for JavaScript."""
         parser = get_parser(Language.JAVASCRIPT)
@@ -222,5 +321,6 @@ class TestGetParser:
 
     def test_unsupported_language_raises(self) -> None:
         """Requesting a parser for an uninstalled grammar raises UnsupportedLanguageError."""
+        clear_parser_cache()
         with pytest.raises(UnsupportedLanguageError, match="makefile"):
             get_parser(Language.MAKEFILE)
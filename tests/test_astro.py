@@ -286,7 +286,7 @@ function greet(name) {
             old_path="Page.astro",
             new_path="Page.astro",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=4,
                     old_count=1,
                     new_start=4,
@@ -315,7 +315,7 @@ function greet(name) {
             old_path="Page.astro",
             new_path="Page.astro",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=4,
                     old_count=1,
                     new_start=4,
@@ -342,7 +342,7 @@ function greet(name) {
             old_path="Static.astro",
             new_path="Static.astro",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=1,
                     old_count=1,
                     new_start=1,
@@ -370,7 +370,7 @@ function greet(name) {
             old_path="Page.astro",
             new_path="Page.astro",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=11,
                     old_count=1,
                     new_start=11,
@@ -396,7 +396,7 @@ function greet(name) {
             old_path="Page.astro",
             new_path="Page.astro",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=5,
                     old_count=1,
                     new_start=5,
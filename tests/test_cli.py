@@ -6,6 +6,7 @@ import tomllib
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from diffguard import __version__
@@ -20,13 +21,19 @@ from diffguard.pipeline import PreparedContext
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run each test from tmp_path so the CLI's scan cache stays out of the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+
 def _make_diff_file() -> DiffFile:
     """Create a simple diff file for testing."""
     return DiffFile(
         old_path="test.py",
         new_path="test.py",
         hunks=[
-            DiffHunk(
+            DiffHunk.from_lines(
                 old_start=1,
                 old_count=3,
                 new_start=1,
@@ -150,7 +157,7 @@ class TestAsyncEntryPoint:
     @patch("diffguard.cli.get_commit_hash", return_value="abc123")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -184,7 +191,7 @@ class TestAsyncEntryPoint:
     @patch("diffguard.cli.get_commit_hash", return_value="abc123")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -218,7 +225,7 @@ class TestAsyncEntryPoint:
     @patch("diffguard.cli.get_commit_hash", return_value="abc123")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -393,7 +400,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -429,7 +436,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -465,7 +472,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -502,7 +509,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -549,7 +556,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -596,7 +603,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -641,7 +648,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -678,7 +685,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -725,7 +732,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
@@ -763,7 +770,7 @@ class TestBaselineIntegration:
     @patch("diffguard.cli.load_baseline")
     @patch("diffguard.cli.prepare_file_contexts")
     @patch("diffguard.cli.analyze_staged_changes", new_callable=AsyncMock)
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff")
     @patch("diffguard.cli.load_config")
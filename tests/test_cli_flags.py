@@ -5,6 +5,7 @@ import os
 from pathlib import Path  # noqa: TC003 — used at runtime by tmp_path fixture type hints
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from diffguard.ast.languages import Language
@@ -18,6 +19,13 @@ from diffguard.pipeline import FileContext, PreparedContext
 
 runner = CliRunner()
 
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run each test from tmp_path so the CLI's scan cache stays out of the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+
 _DIFF_TEXT = "diff --git a/test.py b/test.py\n"
 
 
@@ -26,7 +34,7 @@ def _make_diff_file(path: str = "test.py") -> DiffFile:
         old_path=path,
         new_path=path,
         hunks=[
-            DiffHunk(
+            DiffHunk.from_lines(
                 old_start=1,
                 old_count=3,
                 new_start=1,
@@ -79,7 +87,7 @@ _PARSE = "diffguard.cli.parse_diff"
 _ANALYZE = "diffguard.cli.analyze_staged_changes"
 _PREPARE = "diffguard.cli.prepare_file_contexts"
 _ANALYZE_FILES = "diffguard.cli.analyze_files"
-_CLIENT = "diffguard.cli.OpenAIClient"
+_CLIENT = "diffguard.llm.client.OpenAIClient"
 _COMMIT = "diffguard.cli.get_commit_hash"
 _BRANCH = "diffguard.cli.get_branch_name"
 _ENV = {"OPENAI_API_KEY": "test-key"}
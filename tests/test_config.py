@@ -11,7 +11,14 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
-from diffguard.config import CONFIG_FILENAME, DiffguardConfig, find_config_file, load_config
+from diffguard.config import (
+    CONFIG_FILENAME,
+    DiffguardConfig,
+    clear_config_cache,
+    find_config_file,
+    get_default_config,
+    load_config,
+)
 from diffguard.exceptions import ConfigError
 from diffguard.llm.response import ConfidenceLevel
 
@@ -75,6 +82,13 @@ class TestLoadConfigFromFile:
         assert config.scope_size_limit == 200
         assert config.model == "gpt-5.2"
 
+    def test_load_config_defaults_share_instance(self, tmp_path: Path) -> None:
+        """Default configs reuse one validated instance."""
+        empty_file = tmp_path / CONFIG_FILENAME
+        empty_file.write_text("")
+
+        assert load_config(config_path=empty_file) is get_default_config()
+
     def test_load_config_partial_override(self, tmp_path: Path, sample_partial_config_toml: str) -> None:
         """Config partial override - only model specified."""
         config_file = tmp_path / CONFIG_FILENAME
@@ -160,6 +174,9 @@ class TestLoadConfigFromFile:
 class TestFindConfigFile:
     """Test finding config file in directory tree."""
 
+    def setup_method(self) -> None:
+        clear_config_cache()
+
     def test_find_config_in_current_directory(self, tmp_path: Path) -> None:
         """Find config file in current directory."""
         config_file = tmp_path / CONFIG_FILENAME
@@ -190,6 +207,26 @@ class TestFindConfigFile:
 
         assert found is None
 
+    def test_found_path_is_memoized_until_cleared(self, tmp_path: Path) -> None:
+        """Repeated lookups reuse a found path until the cache is cleared."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("model = 'test'")
+        assert find_config_file(tmp_path) == config_file
+
+        config_file.unlink()
+        assert find_config_file(tmp_path) == config_file
+
+        clear_config_cache()
+        assert find_config_file(tmp_path) is None
+
+    def test_miss_is_not_memoized(self, tmp_path: Path) -> None:
+        """A config file created after a failed lookup is found."""
+        assert find_config_file(tmp_path) is None
+
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("model = 'test'")
+        assert find_config_file(tmp_path) == config_file
+
     def test_load_config_from_parent_directory(self, tmp_path: Path) -> None:
         """load_config() finds config in parent directory."""
         config_file = tmp_path / CONFIG_FILENAME
@@ -203,6 +240,30 @@ class TestFindConfigFile:
         assert config.hunk_expansion_lines == 75
 
 
+class TestLoadConfigCache:
+    """Test memoization of parsed config files."""
+
+    def setup_method(self) -> None:
+        clear_config_cache()
+
+    def test_unchanged_file_returns_same_instance(self, tmp_path: Path) -> None:
+        """Loading an unchanged file twice reuses the parsed config."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("hunk_expansion_lines = 75")
+
+        assert load_config(config_path=config_file) is load_config(config_path=config_file)
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path) -> None:
+        """A change in size or modification time invalidates the cached config."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("hunk_expansion_lines = 75")
+        assert load_config(config_path=config_file).hunk_expansion_lines == 75
+
+        config_file.write_text("hunk_expansion_lines = 100")
+
+        assert load_config(config_path=config_file).hunk_expansion_lines == 100
+
+
 class TestConfigFilePermissions:
     """Test config file permission handling."""
 
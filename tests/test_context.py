@@ -10,7 +10,15 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
-from diffguard.context import Region, build_file_regions, expand_hunk, merge_regions, read_file_lines
+from diffguard.context import (
+    Region,
+    build_file_regions,
+    decode_source,
+    expand_hunk,
+    merge_regions,
+    read_file_bytes,
+    read_file_lines,
+)
 from diffguard.exceptions import ContextError
 from diffguard.git import DiffFile, DiffHunk
 
@@ -226,6 +234,20 @@ class TestMergeChain:
         assert result[0].end_line == 30
 
 
+class TestMergeMany:
+    """Large region counts merge into the expected groups."""
+
+    def test_many_unsorted_regions(self) -> None:
+        # Pairs of overlapping regions every 100 lines, shuffled deterministically
+        regions = [Region(start_line=i * 100 + 1, end_line=i * 100 + 20) for i in range(300)]
+        regions += [Region(start_line=i * 100 + 15, end_line=i * 100 + 40) for i in range(300)]
+        regions = regions[::-1]
+        result = merge_regions(regions)
+        assert len(result) == 300
+        assert result[0] == Region(start_line=1, end_line=40)
+        assert result[-1] == Region(start_line=29901, end_line=29940)
+
+
 # === Tests: read_file_lines ===
 
 
@@ -320,6 +342,54 @@ class TestReadFileLinesInvalidUtf8:
         assert any("malformed UTF-8" in r.message for r in caplog.records)
 
 
+class TestReadFileBytes:
+    """Raw content is returned unchanged for parsing."""
+
+    def test_returns_raw_bytes(self, tmp_path: Path) -> None:
+        p = tmp_path / "crlf.py"
+        p.write_bytes(b"x = 1\r\ny = 2\r\n")
+        assert read_file_bytes(p) == b"x = 1\r\ny = 2\r\n"
+
+    def test_binary_file_raises_context_error(self, tmp_path: Path) -> None:
+        p = tmp_path / "binary.dat"
+        p.write_bytes(b"\x00\x01\x02\x03binary content")
+        with pytest.raises(ContextError, match="Binary file"):
+            read_file_bytes(p)
+
+    def test_content_beyond_sniff_window_is_kept(self, tmp_path: Path) -> None:
+        p = tmp_path / "large.py"
+        content = b"x = 1\n" * 5000
+        p.write_bytes(content)
+        assert read_file_bytes(p) == content
+
+    def test_nul_after_sniff_window_is_not_binary(self, tmp_path: Path) -> None:
+        p = tmp_path / "late_nul.txt"
+        content = b"a" * 8192 + b"\x00"
+        p.write_bytes(content)
+        assert read_file_bytes(p) == content
+
+
+class TestDecodeSource:
+    """Raw content is reused for parsing only when it matches the decoded lines."""
+
+    def test_clean_content_returned_unchanged(self, tmp_path: Path) -> None:
+        content = b"x = 1\r\ny = 2\r\n"
+        lines, source = decode_source(content, tmp_path / "crlf.py")
+        assert lines == ["x = 1", "y = 2"]
+        assert source is content
+
+    def test_malformed_utf8_parses_replaced_text(self, tmp_path: Path) -> None:
+        lines, source = decode_source(b"import caf\xe9\n", tmp_path / "bad.py")
+        assert lines == ["import caf\ufffd"]
+        assert source == "import caf\ufffd".encode()
+
+    @pytest.mark.parametrize("separator", [b"\r", b"\x0c", b"\x0b", "\u2028".encode()])
+    def test_extra_line_breaks_rejoined_with_newlines(self, tmp_path: Path, separator: bytes) -> None:
+        lines, source = decode_source(b"a = 1" + separator + b"b = 2\n", tmp_path / "sep.py")
+        assert lines == ["a = 1", "b = 2"]
+        assert source == b"a = 1\nb = 2"
+
+
 # === Tests: build_file_regions ===
 
 
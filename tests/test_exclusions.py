@@ -6,6 +6,7 @@ from diffguard.config import DiffguardConfig
 from diffguard.exclusions import (
     DEFAULT_SENSITIVE_PATTERNS,
     FilterResult,
+    _get_effective_patterns,
     filter_sensitive_files,
     is_sensitive_file,
 )
@@ -229,6 +230,22 @@ def test_disable_default_patterns() -> None:
     assert is_sensitive_file(".env", config) is False
 
 
+def test_effective_patterns_distinguish_default_toggle() -> None:
+    with_defaults = DiffguardConfig(sensitive_patterns=["*.custom"])
+    without_defaults = DiffguardConfig(sensitive_patterns=["*.custom"], use_default_sensitive_patterns=False)
+    # Same user patterns, so cached lookups must still key on the defaults flag
+    assert is_sensitive_file(".env", with_defaults) is True
+    assert is_sensitive_file(".env", without_defaults) is False
+    assert is_sensitive_file(".env", with_defaults) is True
+
+
+def test_effective_patterns_reused_across_equal_configs() -> None:
+    config = DiffguardConfig(sensitive_patterns=["*.custom"])
+    assert config.sensitive_patterns == ("*.custom",)
+    # Keyed on the config's fields, so an equal config hits the same cached index
+    assert _get_effective_patterns(DiffguardConfig(sensitive_patterns=["*.custom"])) is _get_effective_patterns(config)
+
+
 # ── Filter removes sensitive files ──
 
 
@@ -305,6 +322,14 @@ def test_glob_path_pattern_matching() -> None:
     assert is_sensitive_file("config/secrets/api.json", config) is True
 
 
+def test_literal_path_pattern_matches_at_segment_boundary() -> None:
+    config = DiffguardConfig(sensitive_patterns=["deploy/prod.yml"], use_default_sensitive_patterns=False)
+    assert is_sensitive_file("deploy/prod.yml", config) is True
+    assert is_sensitive_file("infra/Deploy/Prod.yml", config) is True
+    assert is_sensitive_file("mydeploy/prod.yml", config) is False
+    assert is_sensitive_file("deploy/prod.yml.bak", config) is False
+
+
 # ── Verbose shows exclusion reason (tested via FilterResult data) ──
 
 
@@ -317,6 +342,14 @@ def test_filter_result_includes_pattern() -> None:
     assert pattern == "*.pem"
 
 
+def test_filter_result_reports_first_matching_pattern() -> None:
+    # Matches both "*.pem" and the later "id_rsa.*" — the earlier pattern is reported
+    diff_files = [_make_diff_file("keys/id_rsa.pem")]
+    result = filter_sensitive_files(diff_files, DiffguardConfig())
+
+    assert result.excluded == [("keys/id_rsa.pem", "*.pem")]
+
+
 # ── Bulk parametrized tests ──
 
 
@@ -2,9 +2,11 @@
 
 import contextlib
 import os
+from pathlib import Path  # noqa: TC003 — used at runtime by tmp_path fixture type hints
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from diffguard.cli import app
@@ -18,12 +20,18 @@ from diffguard.severity import should_block
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run each test from tmp_path so the CLI's scan cache stays out of the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+
 def _make_diff_file() -> DiffFile:
     return DiffFile(
         old_path="test.py",
         new_path="test.py",
         hunks=[
-            DiffHunk(
+            DiffHunk.from_lines(
                 old_start=1,
                 old_count=3,
                 new_start=1,
@@ -77,7 +85,7 @@ def _patch_full_pipeline(
         patch("diffguard.cli.get_staged_diff", return_value="diff --git a/test.py b/test.py\n"),
         patch("diffguard.cli.parse_diff", return_value=[_make_diff_file()]),
         patch("diffguard.cli.prepare_file_contexts", return_value=_make_prepared_context()),
-        patch("diffguard.cli.OpenAIClient"),
+        patch("diffguard.llm.client.OpenAIClient"),
         patch(
             "diffguard.cli.analyze_staged_changes",
             new_callable=AsyncMock,
@@ -200,7 +208,7 @@ class TestExitTwoErrors:
         new_callable=AsyncMock,
         side_effect=LLMServerError("Internal server error"),
     )
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff", return_value="diff --git a/test.py b/test.py\n")
     @patch("diffguard.cli.load_config", return_value=DiffguardConfig())
@@ -231,7 +239,7 @@ class TestExitTwoErrors:
         new_callable=AsyncMock,
         side_effect=LLMTimeoutError("Timed out"),
     )
-    @patch("diffguard.cli.OpenAIClient")
+    @patch("diffguard.llm.client.OpenAIClient")
     @patch("diffguard.cli.parse_diff")
     @patch("diffguard.cli.get_staged_diff", return_value="diff --git a/test.py b/test.py\n")
     @patch("diffguard.cli.load_config", return_value=DiffguardConfig())
@@ -1,6 +1,9 @@
 """Tests for git diff parsing and extraction."""
 
+from __future__ import annotations
+
 import subprocess
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,13 +13,20 @@ from diffguard.git import (
     DiffFile,
     DiffHunk,
     _parse_c_quoted,
+    clear_git_repo_cache,
     get_branch_name,
     get_commit_hash,
     get_staged_diff,
     is_git_repo,
+    iter_diff_files,
     parse_diff,
+    parse_diff_lines,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 # === Test fixtures (inline as specified by TASKS.md) ===
 
 SAMPLE_SINGLE_FILE_DIFF = """\
@@ -216,28 +226,31 @@ index abc123..def456 100644
 class TestParseSingleFileDiff:
     """Parse single-file diff."""
 
-    def test_single_file_returns_one_diff_file(self) -> None:
-        result = parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+
+    def test_single_file_returns_one_diff_file(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
 
-    def test_single_file_has_correct_path(self) -> None:
-        result = parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+    def test_single_file_has_correct_path(self, result: list[DiffFile]) -> None:
         assert result[0].path == "src/main.py"
 
-    def test_single_file_has_hunks(self) -> None:
-        result = parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+    def test_single_file_has_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 1
 
 
 class TestParseMultiFileDiff:
     """Parse multi-file diff."""
 
-    def test_multi_file_returns_correct_count(self) -> None:
-        result = parse_diff(SAMPLE_MULTI_FILE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_MULTI_FILE_DIFF)
+
+    def test_multi_file_returns_correct_count(self, result: list[DiffFile]) -> None:
         assert len(result) == 3
 
-    def test_multi_file_has_correct_paths(self) -> None:
-        result = parse_diff(SAMPLE_MULTI_FILE_DIFF)
+    def test_multi_file_has_correct_paths(self, result: list[DiffFile]) -> None:
         paths = [f.path for f in result]
         assert paths == ["src/a.py", "src/b.py", "src/c.py"]
 
@@ -245,71 +258,74 @@ class TestParseMultiFileDiff:
 class TestDetectNewFile:
     """Detect new file."""
 
-    def test_new_file_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_NEW_FILE_DIFF)
+
+    def test_new_file_flag_is_set(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert result[0].is_new_file is True
 
-    def test_new_file_has_correct_path(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_DIFF)
+    def test_new_file_has_correct_path(self, result: list[DiffFile]) -> None:
         assert result[0].path == "src/new.py"
 
-    def test_new_file_has_hunks(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_DIFF)
+    def test_new_file_has_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 1
 
 
 class TestDetectDeletedFile:
     """Detect deleted file."""
 
-    def test_deleted_file_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_DELETED_FILE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_DELETED_FILE_DIFF)
+
+    def test_deleted_file_flag_is_set(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert result[0].is_deleted is True
 
-    def test_deleted_file_has_correct_path(self) -> None:
-        result = parse_diff(SAMPLE_DELETED_FILE_DIFF)
+    def test_deleted_file_has_correct_path(self, result: list[DiffFile]) -> None:
         assert result[0].path == "src/old.py"
 
-    def test_deleted_file_has_hunks(self) -> None:
-        result = parse_diff(SAMPLE_DELETED_FILE_DIFF)
+    def test_deleted_file_has_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 1
 
 
 class TestDetectRenamedFile:
     """Detect renamed file."""
 
-    def test_renamed_file_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_FILE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_RENAMED_FILE_DIFF)
+
+    def test_renamed_file_flag_is_set(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert result[0].is_renamed is True
 
-    def test_renamed_file_has_correct_old_path(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_FILE_DIFF)
+    def test_renamed_file_has_correct_old_path(self, result: list[DiffFile]) -> None:
         assert result[0].old_path == "old_name.py"
 
-    def test_renamed_file_has_correct_new_path(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_FILE_DIFF)
+    def test_renamed_file_has_correct_new_path(self, result: list[DiffFile]) -> None:
         assert result[0].new_path == "new_name.py"
 
-    def test_renamed_file_without_changes_has_no_hunks(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_FILE_DIFF)
+    def test_renamed_file_without_changes_has_no_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 0
 
 
 class TestDetectRenamedFileWithChanges:
     """Detect renamed file with changes."""
 
-    def test_renamed_with_changes_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_WITH_CHANGES_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_RENAMED_WITH_CHANGES_DIFF)
+
+    def test_renamed_with_changes_flag_is_set(self, result: list[DiffFile]) -> None:
         assert result[0].is_renamed is True
 
-    def test_renamed_with_changes_has_hunks(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_WITH_CHANGES_DIFF)
+    def test_renamed_with_changes_has_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) > 0
 
-    def test_renamed_with_changes_has_correct_paths(self) -> None:
-        result = parse_diff(SAMPLE_RENAMED_WITH_CHANGES_DIFF)
+    def test_renamed_with_changes_has_correct_paths(self, result: list[DiffFile]) -> None:
         assert result[0].old_path == "old_name.py"
         assert result[0].new_path == "new_name.py"
 
@@ -348,16 +364,39 @@ class TestParseHunkHeaderWithContext:
         assert hunk.new_start == 12
 
 
+class TestParseHunkHeaderMalformed:
+    """Malformed @@ lines are not treated as hunk headers."""
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "@@ -1, +1 @@",
+            "@@ -a,1 +1 @@",
+            "@@ -1,2 +3,4",
+            "@@ -1,2 3,4 @@",
+            "@@ -1,2 +3,4 5 @@",
+            "@@ -\u0661,2 +3,4 @@",
+            "@@ -1,2 +3,\u0664 @@",
+        ],
+    )
+    def test_malformed_header_starts_no_hunk(self, header: str) -> None:
+        diff = f"diff --git a/f.py b/f.py\n--- a/f.py\n+++ b/f.py\n{header}\n+x\n"
+        result = parse_diff(diff)
+        assert result[0].hunks == []
+
+
 class TestParseMultipleHunks:
     """Parse multiple hunks in single file."""
 
-    def test_multiple_hunks_count(self) -> None:
-        result = parse_diff(SAMPLE_MULTIPLE_HUNKS_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_MULTIPLE_HUNKS_DIFF)
+
+    def test_multiple_hunks_count(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert len(result[0].hunks) == 3
 
-    def test_multiple_hunks_have_correct_ranges(self) -> None:
-        result = parse_diff(SAMPLE_MULTIPLE_HUNKS_DIFF)
+    def test_multiple_hunks_have_correct_ranges(self, result: list[DiffFile]) -> None:
         hunks = result[0].hunks
         assert hunks[0].old_start == 5
         assert hunks[1].old_start == 20
@@ -376,23 +415,41 @@ class TestBinaryFile:
         result = parse_diff(SAMPLE_BINARY_FILE_DIFF)
         assert len(result[0].hunks) == 0
 
+    def test_lines_after_binary_marker_are_skipped(self) -> None:
+        diff = (
+            "diff --git a/logo.png b/logo.png\n"
+            "Binary files a/logo.png and b/logo.png differ\n"
+            "+++ b/elsewhere.png\n"
+            "@@ -1 +1 @@\n"
+            "diff --git a/app.py b/app.py\n"
+            "--- a/app.py\n"
+            "+++ b/app.py\n"
+            "@@ -1 +1 @@\n"
+            "+x\n"
+        )
+        result = parse_diff(diff)
+        assert [f.path for f in result] == ["logo.png", "app.py"]
+        assert result[0].hunks == []
+        assert len(result[1].hunks) == 1
+
 
 class TestMixedBinaryTextFiles:
     """Handle mixed binary and text files."""
 
-    def test_mixed_returns_correct_count(self) -> None:
-        result = parse_diff(SAMPLE_MIXED_BINARY_TEXT_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_MIXED_BINARY_TEXT_DIFF)
+
+    def test_mixed_returns_correct_count(self, result: list[DiffFile]) -> None:
         assert len(result) == 3
 
-    def test_mixed_binary_file_marked_correctly(self) -> None:
-        result = parse_diff(SAMPLE_MIXED_BINARY_TEXT_DIFF)
+    def test_mixed_binary_file_marked_correctly(self, result: list[DiffFile]) -> None:
         binary_files = [f for f in result if f.is_binary]
         text_files = [f for f in result if not f.is_binary]
         assert len(binary_files) == 1
         assert len(text_files) == 2
 
-    def test_mixed_binary_file_has_correct_path(self) -> None:
-        result = parse_diff(SAMPLE_MIXED_BINARY_TEXT_DIFF)
+    def test_mixed_binary_file_has_correct_path(self, result: list[DiffFile]) -> None:
         binary_file = next(f for f in result if f.is_binary)
         assert binary_file.path == "logo.png"
 
@@ -426,13 +483,15 @@ class TestWhitespaceOnlyDiff:
 class TestModeChangeOnly:
     """File mode change only (no content)."""
 
-    def test_mode_changed_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_MODE_CHANGE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_MODE_CHANGE_DIFF)
+
+    def test_mode_changed_flag_is_set(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert result[0].mode_changed is True
 
-    def test_mode_change_has_empty_hunks(self) -> None:
-        result = parse_diff(SAMPLE_MODE_CHANGE_DIFF)
+    def test_mode_change_has_empty_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 0
 
 
@@ -482,18 +541,19 @@ class TestFilePathsWithSpaces:
 class TestNewFileWithSpaceInPath:
     """Handle new file with space in name and trailing tab from git."""
 
-    def test_new_file_path_has_no_trailing_whitespace(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_WITH_SPACE_DIFF)
+    @pytest.fixture(scope="class")
+    def result(self) -> list[DiffFile]:
+        return parse_diff(SAMPLE_NEW_FILE_WITH_SPACE_DIFF)
+
+    def test_new_file_path_has_no_trailing_whitespace(self, result: list[DiffFile]) -> None:
         assert len(result) == 1
         assert result[0].new_path == "src/my module.py"
         assert result[0].path == "src/my module.py"
 
-    def test_new_file_flag_is_set(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_WITH_SPACE_DIFF)
+    def test_new_file_flag_is_set(self, result: list[DiffFile]) -> None:
         assert result[0].is_new_file is True
 
-    def test_new_file_has_hunks(self) -> None:
-        result = parse_diff(SAMPLE_NEW_FILE_WITH_SPACE_DIFF)
+    def test_new_file_has_hunks(self, result: list[DiffFile]) -> None:
         assert len(result[0].hunks) == 1
 
 
@@ -506,6 +566,16 @@ class TestPathContainingBSlash:
         assert result[0].path == "src/my b/dir/file.py"
 
 
+class TestPathContainingSeparator:
+    """Paths that contain the " b/" separator themselves."""
+
+    def test_same_path_split_in_the_middle(self) -> None:
+        diff = "diff --git a/x b/y b/x b/y\nnew file mode 100644\n"
+        result = parse_diff(diff)
+        assert result[0].old_path == "x b/y"
+        assert result[0].new_path == "x b/y"
+
+
 class TestFilePathsWithSpecialChars:
     """Handle file paths with special characters."""
 
@@ -518,6 +588,9 @@ class TestFilePathsWithSpecialChars:
 class TestIsGitRepo:
     """is_git_repo."""
 
+    def setup_method(self) -> None:
+        clear_git_repo_cache()
+
     @patch("diffguard.git.subprocess.run")
     def test_returns_true_for_valid_repo(self, mock_run: MagicMock) -> None:
         """is_git_repo returns True for valid repo."""
@@ -546,6 +619,33 @@ class TestIsGitRepo:
     def test_returns_false_on_timeout(self, _mock_run: MagicMock) -> None:
         assert is_git_repo() is False
 
+    @patch("diffguard.git.subprocess.run")
+    def test_result_cached_per_directory(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        assert is_git_repo() is True
+        assert is_git_repo() is True
+        assert mock_run.call_count == 1
+
+        clear_git_repo_cache()
+        assert is_git_repo() is True
+        assert mock_run.call_count == 2
+
+    @patch("diffguard.git.subprocess.run")
+    def test_negative_answer_not_cached(self, mock_run: MagicMock) -> None:
+        mock_run.side_effect = [MagicMock(returncode=128), MagicMock(returncode=0)]
+
+        assert is_git_repo() is False
+        # e.g. `git init` ran in the meantime
+        assert is_git_repo() is True
+        assert mock_run.call_count == 2
+
+    @patch("diffguard.git.subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="git", timeout=30))
+    def test_failed_check_not_cached(self, mock_run: MagicMock) -> None:
+        assert is_git_repo() is False
+        assert is_git_repo() is False
+        assert mock_run.call_count == 2
+
 
 class TestGetStagedDiff:
     """get_staged_diff."""
@@ -612,6 +712,60 @@ class TestGetStagedDiff:
         assert "image.png" in result
         assert "Binary files" in result
 
+    def test_non_ascii_path_is_not_quoted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        (tmp_path / "café.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "café.py"], cwd=tmp_path, capture_output=True, check=True)
+        monkeypatch.chdir(tmp_path)
+
+        header = next(line for line in get_staged_diff().split("\n") if line.startswith("diff --git "))
+
+        assert header == "diff --git a/café.py b/café.py"
+
+
+class TestParseDiffFromLineIterable:
+    """Parsing from an iterable of lines."""
+
+    def test_matches_parse_diff(self) -> None:
+        from_lines = parse_diff_lines(iter(SAMPLE_MULTI_FILE_DIFF.split("\n")))
+        assert from_lines == parse_diff(SAMPLE_MULTI_FILE_DIFF)
+
+    def test_empty_iterable_returns_empty_list(self) -> None:
+        assert parse_diff_lines([]) == []
+
+    def test_iter_diff_files_yields_each_file_before_reading_the_next(self) -> None:
+        consumed: list[str] = []
+
+        def tracked() -> Iterator[str]:
+            for line in SAMPLE_MULTI_FILE_DIFF.split("\n"):
+                consumed.append(line)
+                yield line
+
+        files = iter_diff_files(tracked())
+        first = next(files)
+
+        assert first == parse_diff(SAMPLE_MULTI_FILE_DIFF)[0]
+        assert consumed[-1].startswith("diff --git ")
+        assert sum(line.startswith("diff --git ") for line in consumed) == 2
+
+
+class TestPathInterning:
+    """Parsed paths share one string object."""
+
+    def test_header_and_path_lines_share_object(self) -> None:
+        files = parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+
+        assert files[0].old_path is files[0].new_path
+
+    def test_long_path_is_not_interned(self) -> None:
+        long_path = "d/" * 200 + "f.py"
+        diff = f"diff --git a/{long_path} b/{long_path}\n--- a/{long_path}\n+++ b/{long_path}\n@@ -1 +1 @@\n-a\n+b\n"
+
+        files = parse_diff(diff)
+
+        assert files[0].new_path == long_path
+        assert files[0].old_path is not files[0].new_path
+
 
 class TestCQuotedParsing:
     """C-style quoted string parsing."""
@@ -630,7 +784,26 @@ class TestCQuotedParsing:
 
     def test_octal_escape(self) -> None:
         content, _ = _parse_c_quoted(r'"caf\303\251.py"')
-        assert content == "caf\u00c3\u00a9.py"
+        assert content == "café.py"
+
+    def test_invalid_utf8_octal_escape_is_replaced(self) -> None:
+        content, _ = _parse_c_quoted(r'"bad\377.py"')
+        assert content == "bad\ufffd.py"
+
+    def test_token_scan_decodes_octal_escapes_as_utf8(self) -> None:
+        # The non-octal \9 escape sends the body through the token scan
+        content, _ = _parse_c_quoted(r'"caf\303\251\9.py"')
+        assert content == "café9.py"
+
+    def test_token_scan_replaces_invalid_utf8_like_fast_path(self) -> None:
+        fast, _ = _parse_c_quoted(r'"caf\351.py"')
+        scanned, _ = _parse_c_quoted(r'"caf\351\9.py"')
+        assert fast == "caf\ufffd.py"
+        assert scanned == "caf\ufffd9.py"
+
+    def test_non_octal_digit_escape_keeps_digit(self) -> None:
+        content, _ = _parse_c_quoted(r'"file\9.py"')
+        assert content == "file9.py"
 
     def test_remainder_returned(self) -> None:
         content, remainder = _parse_c_quoted('"a/b" "c/d"')
@@ -815,9 +988,33 @@ class TestDiffHunkDataclass:
 
     def test_default_lines_is_empty(self) -> None:
         h = DiffHunk(old_start=1, old_count=1, new_start=1, new_count=1)
-        assert h.lines == []
+        assert h.lines == ()
 
-    def test_lines_are_mutable(self) -> None:
+    def test_lines_pairs_signs_with_texts(self) -> None:
         h = DiffHunk(old_start=1, old_count=1, new_start=1, new_count=1)
-        h.lines.append(("+", "new line"))
-        assert len(h.lines) == 1
+        h.signs.append(ord("+"))
+        h.texts.append("new line")
+        assert h.lines == (("+", "new line"),)
+
+    def test_from_lines_round_trips(self) -> None:
+        pairs = [(" ", "ctx"), ("-", "old"), ("+", "new")]
+        h = DiffHunk.from_lines(old_start=1, old_count=2, new_start=1, new_count=2, lines=pairs)
+        assert h.signs == bytearray(b" -+")
+        assert h.texts == ["ctx", "old", "new"]
+        assert h.lines == tuple(pairs)
+
+    def test_constructor_accepts_lines(self) -> None:
+        pairs = [(" ", "ctx"), ("+", "new")]
+        h = DiffHunk(old_start=1, old_count=1, new_start=1, new_count=2, lines=pairs)
+        assert h == DiffHunk.from_lines(old_start=1, old_count=1, new_start=1, new_count=2, lines=pairs)
+        assert DiffHunk(1, 1, 1, 2, pairs) == h
+
+    def test_constructor_rejects_lines_with_columns(self) -> None:
+        with pytest.raises(TypeError, match="either lines or signs/texts"):
+            DiffHunk(old_start=1, old_count=1, new_start=1, new_count=1, lines=[], texts=[])
+
+    def test_lines_is_read_only(self) -> None:
+        h = DiffHunk.from_lines(old_start=1, old_count=1, new_start=1, new_count=1, lines=[("+", "a")])
+        with pytest.raises(AttributeError):
+            h.lines.append(("+", "b"))  # type: ignore[attr-defined]
+        assert h.texts == ["a"]
@@ -43,7 +43,7 @@ def _make_diff_file(path: str) -> DiffFile:
     return DiffFile(
         old_path=path,
         new_path=path,
-        hunks=[DiffHunk(old_start=1, old_count=1, new_start=1, new_count=1, lines=[("+", "x")])],
+        hunks=[DiffHunk.from_lines(old_start=1, old_count=1, new_start=1, new_count=1, lines=[("+", "x")])],
         is_new_file=False,
         is_deleted=False,
         is_binary=False,
@@ -24,6 +24,7 @@ from diffguard.llm.response import ConfidenceLevel, SeverityLevel
 from diffguard.pipeline import (
     FileContext,
     _build_diff_lines,
+    _build_file_context,
     _file_context_to_code_context,
     _filter_analyzable_files,
     analyze_staged_changes,
@@ -61,7 +62,7 @@ def _make_diff_file(
     """Create a DiffFile for testing."""
     if hunks is None:
         hunks = [
-            DiffHunk(
+            DiffHunk.from_lines(
                 old_start=3,
                 old_count=2,
                 new_start=3,
@@ -107,7 +108,7 @@ class TestBuildDiffLines:
     def test_tracks_line_numbers_for_additions(self) -> None:
         diff_file = _make_diff_file(
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=1,
                     old_count=3,
                     new_start=1,
@@ -131,7 +132,7 @@ class TestBuildDiffLines:
     def test_removals_do_not_advance_counter(self) -> None:
         diff_file = _make_diff_file(
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=1,
                     old_count=3,
                     new_start=1,
@@ -157,8 +158,8 @@ class TestBuildDiffLines:
     def test_multiple_hunks(self) -> None:
         diff_file = _make_diff_file(
             hunks=[
-                DiffHunk(old_start=1, old_count=1, new_start=1, new_count=1, lines=[("+", "a")]),
-                DiffHunk(old_start=10, old_count=1, new_start=10, new_count=1, lines=[("+", "b")]),
+                DiffHunk.from_lines(old_start=1, old_count=1, new_start=1, new_count=1, lines=[("+", "a")]),
+                DiffHunk.from_lines(old_start=10, old_count=1, new_start=10, new_count=1, lines=[("+", "b")]),
             ]
         )
         result = _build_diff_lines(diff_file)
@@ -404,7 +405,7 @@ class TestPipelineNewFiles:
             "new.py",
             is_new_file=True,
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=0,
                     old_count=0,
                     new_start=1,
@@ -434,6 +435,53 @@ class TestPipelineNewFiles:
         assert len(region_lines) == len(PYTHON_LINES)
 
 
+# ---------------------------------------------------------------------------
+# TestBuildFileContextDecoding
+# ---------------------------------------------------------------------------
+
+
+def _line_hunk(line: int, text: str) -> DiffHunk:
+    """Create a hunk that changes a single line."""
+    return DiffHunk.from_lines(old_start=line, old_count=1, new_start=line, new_count=1, lines=[("+", text)])
+
+
+class TestBuildFileContextDecoding:
+    """Scopes stay aligned with source lines whatever the file's encoding or separators."""
+
+    def test_malformed_utf8_still_builds_scopes(self, tmp_path: Path) -> None:
+        (tmp_path / "bad.py").write_bytes(b"import caf\xe9\nx = caf\xe9.y\n")
+        diff_file = _make_diff_file("bad.py", hunks=[_line_hunk(2, "x = caf\ufffd.y")])
+
+        file_ctx = _build_file_context(diff_file, Language.PYTHON, _default_config(), tmp_path)
+
+        assert file_ctx.source_lines == ["import caf\ufffd", "x = caf\ufffd.y"]
+        assert file_ctx.regions
+
+    def test_form_feed_does_not_shift_scope_rows(self, tmp_path: Path) -> None:
+        source = b"def a():\n    return 1\n\x0c\ndef b():\n    x = 2\n    return x\n"
+        (tmp_path / "ff.py").write_bytes(source)
+        diff_file = _make_diff_file("ff.py", hunks=[_line_hunk(5, "    x = 2")])
+
+        file_ctx = _build_file_context(diff_file, Language.PYTHON, _default_config(), tmp_path)
+
+        assert file_ctx.source_lines[4] == "def b():"
+        assert [s.name for s in file_ctx.scopes] == ["b"]
+        assert file_ctx.scopes[0].start_line == 5
+
+    def test_crlf_file_keeps_names_and_sources_clean(self, tmp_path: Path) -> None:
+        (tmp_path / "helpers.py").write_bytes(b"def util(v):\r\n    return v * 2\r\n")
+        source = b"from helpers import util\r\n\r\ndef handler(x):\r\n    y = util(x)\r\n    return y\r\n"
+        (tmp_path / "app.py").write_bytes(source)
+        diff_file = _make_diff_file("app.py", hunks=[_line_hunk(4, "    y = util(x)")])
+
+        file_ctx = _build_file_context(diff_file, Language.PYTHON, _default_config(), tmp_path)
+
+        assert [(s.name, s.start_line, s.end_line) for s in file_ctx.scopes] == [("handler", 3, 5)]
+        assert file_ctx.scopes[0].source == "def handler(x):\n    y = util(x)\n    return y"
+        assert list(file_ctx.symbols) == ["util"]
+        assert file_ctx.symbols["util"].code == "def util(v):\n    return v * 2"
+
+
 # ---------------------------------------------------------------------------
 # TestPipelineDeletedFiles
 # ---------------------------------------------------------------------------
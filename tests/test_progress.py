@@ -48,7 +48,7 @@ def _make_diff_file(path: str = "test.py") -> DiffFile:
         old_path=path,
         new_path=path,
         hunks=[
-            DiffHunk(
+            DiffHunk.from_lines(
                 old_start=1,
                 old_count=3,
                 new_start=1,
@@ -102,7 +102,7 @@ _PARSE = "diffguard.cli.parse_diff"
 _ANALYZE = "diffguard.cli.analyze_staged_changes"
 _PREPARE = "diffguard.cli.prepare_file_contexts"
 _ANALYZE_FILES = "diffguard.cli.analyze_files"
-_CLIENT = "diffguard.cli.OpenAIClient"
+_CLIENT = "diffguard.llm.client.OpenAIClient"
 _COMMIT = "diffguard.cli.get_commit_hash"
 _BRANCH = "diffguard.cli.get_branch_name"
 _ENV = {"OPENAI_API_KEY": "test-key"}
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
+import pytest
+
 from diffguard.ast import Language, parse_file
 from diffguard.ast.scope import Scope, extract_scope_context, find_enclosing_scope
 
@@ -22,6 +25,7 @@ def foo(a: int, b: int) -> int:
 
 y = 2
 """
+SIMPLE_FUNCTION_LINES = SIMPLE_FUNCTION.splitlines()
 
 ASYNC_FUNCTION = """\
 import asyncio
@@ -108,6 +112,7 @@ EMPTY_FUNCTION = """\
 def empty():
     pass
 """
+EMPTY_FUNCTION_LINES = EMPTY_FUNCTION.splitlines()
 
 MULTILINE_SIGNATURE = """\
 def complex_function(
@@ -121,14 +126,22 @@ def complex_function(
     return {"a": x, "b": y}
 """
 
+# A 302-line function, large enough to exceed the truncation limit
+LARGE_FUNCTION_LINES = ["def large_function():", *(f"    line_{i} = {i}" for i in range(300)), "    pass"]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@cache
 def _parse(source: str) -> Tree:
-    """Parse Python source and return a tree-sitter Tree."""
+    """Parse Python source and return a tree-sitter Tree.
+
+    Trees are memoized per source string; scope lookups only read them, so
+    tests share one parse of each fixture.
+    """
     tree = parse_file(source, Language.PYTHON)
     assert tree is not None
     return tree
@@ -217,47 +230,35 @@ class TestFindEnclosingScope:
         assert scope.name == "foo"
         assert scope.end_line == 4
 
-    def test_decorated_function_includes_decorator(self) -> None:
-        tree = _parse(DECORATED_SINGLE)
-        scope = find_enclosing_scope(tree, 3, Language.PYTHON)
-        assert scope is not None
-        assert scope.type == "function"
-        assert scope.name == "decorated_func"
-        assert scope.start_line == 1  # Includes @my_decorator
-        assert scope.end_line == 3
-
-    def test_multiple_decorators_included(self) -> None:
-        tree = _parse(DECORATED_MULTIPLE)
-        scope = find_enclosing_scope(tree, 5, Language.PYTHON)
-        assert scope is not None
-        assert scope.name == "my_function"
-        assert scope.start_line == 1  # All 3 decorators included
-        assert scope.end_line == 5
-
-    def test_class_with_decorator(self) -> None:
-        tree = _parse(DECORATED_CLASS)
-        scope = find_enclosing_scope(tree, 3, Language.PYTHON)
+    @pytest.mark.parametrize(
+        ("source", "line", "scope_type", "name", "end_line"),
+        [
+            (DECORATED_SINGLE, 3, "function", "decorated_func", 3),
+            (DECORATED_MULTIPLE, 5, "function", "my_function", 5),
+            (DECORATED_CLASS, 3, "class", "Config", 4),
+        ],
+        ids=["single_decorator", "multiple_decorators", "decorated_class"],
+    )
+    def test_decorated_definition_includes_decorators(
+        self, source: str, line: int, scope_type: str, name: str, end_line: int
+    ) -> None:
+        scope = find_enclosing_scope(_parse(source), line, Language.PYTHON)
         assert scope is not None
-        assert scope.type == "class"
-        assert scope.name == "Config"
-        assert scope.start_line == 1  # Includes @dataclass
-        assert scope.end_line == 4
+        assert scope.type == scope_type
+        assert scope.name == name
+        assert scope.start_line == 1  # Starts at the first decorator, not the def/class line
+        assert scope.end_line == end_line
 
     def test_scope_truncation_over_limit(self) -> None:
-        body_lines = [f"    line_{i} = {i}" for i in range(300)]
-        source = "def large_function():\n" + "\n".join(body_lines) + "\n    pass\n"
-        source_lines = source.splitlines()
+        source_lines = LARGE_FUNCTION_LINES
         scope = Scope(type="function", name="large_function", start_line=1, end_line=len(source_lines))
         result = extract_scope_context(scope, source_lines, limit=200)
-        result_lines = result.split("\n")
-        assert result_lines[-1] == f"... [truncated {len(source_lines) - 200} lines]"
+        assert result.rsplit("\n", 1)[-1] == f"... [truncated {len(source_lines) - 200} lines]"
         # First 200 lines are preserved (plus the truncation marker line)
-        assert len(result_lines) == 201
+        assert result.count("\n") == 200
 
     def test_scope_truncation_preserves_signature(self) -> None:
-        body_lines = [f"    line_{i} = {i}" for i in range(100)]
-        source = MULTILINE_SIGNATURE.rstrip("\n") + "\n" + "\n".join(body_lines) + "\n"
-        source_lines = source.splitlines()
+        source_lines = [*MULTILINE_SIGNATURE.splitlines(), *(f"    line_{i} = {i}" for i in range(100))]
         scope = Scope(type="function", name="complex_function", start_line=1, end_line=len(source_lines))
         result = extract_scope_context(scope, source_lines, limit=50)
         # The 6-line signature must be included in the first 50 lines
@@ -265,17 +266,21 @@ class TestFindEnclosingScope:
         assert ") -> dict:" in result
 
     def test_scope_under_limit_returns_full(self) -> None:
-        source_lines = SIMPLE_FUNCTION.splitlines()
         scope = Scope(type="function", name="foo", start_line=3, end_line=4)
-        result = extract_scope_context(scope, source_lines, limit=200)
+        result = extract_scope_context(scope, SIMPLE_FUNCTION_LINES, limit=200)
         assert "... [truncated" not in result
         assert "def foo(a: int, b: int) -> int:" in result
         assert "return a + b" in result
 
+    def test_scope_truncation_mid_file(self) -> None:
+        source_lines = ["x = 1", "", *[f"line_{i}" for i in range(10)], "y = 2"]
+        scope = Scope(type="function", name="f", start_line=3, end_line=12)
+        result = extract_scope_context(scope, source_lines, limit=4)
+        assert result == "line_0\nline_1\nline_2\nline_3\n... [truncated 6 lines]"
+
     def test_scope_extraction_empty_function(self) -> None:
-        source_lines = EMPTY_FUNCTION.splitlines()
         scope = Scope(type="function", name="empty", start_line=1, end_line=2)
-        result = extract_scope_context(scope, source_lines, limit=200)
+        result = extract_scope_context(scope, EMPTY_FUNCTION_LINES, limit=200)
         assert "def empty():" in result
         assert "pass" in result
 
@@ -287,37 +292,24 @@ class TestFindEnclosingScope:
         assert scope.type == "function"
         assert scope.name == "process"
 
-    def test_static_method_scope(self) -> None:
+    @pytest.mark.parametrize(
+        ("line", "name", "start_line"),
+        [
+            (4, "static_method", 2),  # `pass` inside static_method; includes @staticmethod
+            (8, "class_method", 6),  # `pass` inside class_method; includes @classmethod
+            (12, "my_property", 10),  # `return self._value` inside my_property; includes @property
+        ],
+    )
+    def test_decorated_method_scope(self, line: int, name: str, start_line: int) -> None:
         tree = _parse(STATIC_CLASS_PROPERTY)
-        # Line 4 is `pass` inside static_method
-        scope = find_enclosing_scope(tree, 4, Language.PYTHON)
+        scope = find_enclosing_scope(tree, line, Language.PYTHON)
         assert scope is not None
         assert scope.type == "function"
-        assert scope.name == "static_method"
-        assert scope.start_line == 2  # Includes @staticmethod
-
-    def test_class_method_scope(self) -> None:
-        tree = _parse(STATIC_CLASS_PROPERTY)
-        # Line 8 is `pass` inside class_method
-        scope = find_enclosing_scope(tree, 8, Language.PYTHON)
-        assert scope is not None
-        assert scope.type == "function"
-        assert scope.name == "class_method"
-        assert scope.start_line == 6  # Includes @classmethod
-
-    def test_property_scope(self) -> None:
-        tree = _parse(STATIC_CLASS_PROPERTY)
-        # Line 12 is `return self._value` inside my_property
-        scope = find_enclosing_scope(tree, 12, Language.PYTHON)
-        assert scope is not None
-        assert scope.type == "function"
-        assert scope.name == "my_property"
-        assert scope.start_line == 10  # Includes @property
+        assert scope.name == name
+        assert scope.start_line == start_line
 
     def test_new_file_exempt_from_truncation(self) -> None:
-        body_lines = [f"    line_{i} = {i}" for i in range(300)]
-        source = "def large_function():\n" + "\n".join(body_lines) + "\n    pass\n"
-        source_lines = source.splitlines()
+        source_lines = LARGE_FUNCTION_LINES
         scope = Scope(type="function", name="large_function", start_line=1, end_line=len(source_lines))
         result = extract_scope_context(scope, source_lines, limit=200, is_new_file=True)
         assert "... [truncated" not in result
@@ -357,6 +349,16 @@ class TestFindEnclosingScopeEdgeCases:
         assert scope.name == "decorated_func"
         assert scope.start_line == 1
 
+    def test_many_top_level_definitions(self) -> None:
+        source = "".join(f"def func_{i}():\n    return {i}\n\n" for i in range(100))
+        tree = _parse(source)
+        # func_57 starts on line 57 * 3 + 1 = 172
+        scope = find_enclosing_scope(tree, 173, Language.PYTHON)
+        assert scope is not None
+        assert scope.name == "func_57"
+        assert scope.start_line == 172
+        assert find_enclosing_scope(tree, 174, Language.PYTHON) is None
+
     def test_another_method_in_nested_scopes(self) -> None:
         tree = _parse(NESTED_SCOPES)
         # Line 8 is `pass` in another_method
@@ -277,7 +277,7 @@ function increment() {
             old_path="Counter.svelte",
             new_path="Counter.svelte",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=4,
                     old_count=1,
                     new_start=4,
@@ -308,7 +308,7 @@ function increment() {
             old_path="Counter.svelte",
             new_path="Counter.svelte",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=5,
                     old_count=1,
                     new_start=5,
@@ -334,7 +334,7 @@ function increment() {
             old_path="Static.svelte",
             new_path="Static.svelte",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=1,
                     old_count=1,
                     new_start=1,
@@ -362,7 +362,7 @@ function increment() {
             old_path="App.svelte",
             new_path="App.svelte",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=10,
                     old_count=1,
                     new_start=10,
@@ -388,7 +388,7 @@ function increment() {
             old_path="App.svelte",
             new_path="App.svelte",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=4,
                     old_count=1,
                     new_start=4,
@@ -297,7 +297,7 @@ export default {
             old_path="App.vue",
             new_path="App.vue",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=8,
                     old_count=1,
                     new_start=8,
@@ -344,7 +344,7 @@ export default defineComponent({
             old_path="Counter.vue",
             new_path="Counter.vue",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=10,
                     old_count=1,
                     new_start=10,
@@ -371,7 +371,7 @@ export default defineComponent({
             old_path="Static.vue",
             new_path="Static.vue",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=2,
                     old_count=1,
                     new_start=2,
@@ -400,7 +400,7 @@ export default defineComponent({
             old_path="App.vue",
             new_path="App.vue",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=3,
                     old_count=1,
                     new_start=3,
@@ -428,7 +428,7 @@ export default defineComponent({
             old_path="App.vue",
             new_path="App.vue",
             hunks=[
-                DiffHunk(
+                DiffHunk.from_lines(
                     old_start=8,
                     old_count=1,
                     new_start=8,